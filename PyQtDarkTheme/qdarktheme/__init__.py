@@ -42,4 +42,21 @@ https://github.com/ColinDuquesnoy/QDarkStyleSheet/blob/master/LICENSE.rst
 # Version of PyQtDarkTheme
 __version__ = "2.3.2"
 
-from qdarktheme._style_loader import load_stylesheet
+from qdarktheme._accent import accent_palette, accent_palettes
+from qdarktheme._style_loader import (
+    apply_to,
+    audit_contrast,
+    clear_cache,
+    diff_stylesheets,
+    disable_prewarm,
+    enable_prewarm,
+    iter_stylesheet,
+    load_color_table,
+    load_palette,
+    load_stylesheet,
+    load_stylesheet_async,
+    optimize_stylesheet,
+    set_stylesheet_async,
+    write_stylesheet,
+)
+from qdarktheme._sections import used_widget_classes
@@ -0,0 +1,160 @@
+"""Module for deriving the primary colors of a theme from an arbitrary accent color."""
+
+import colorsys
+import json
+from functools import lru_cache
+
+from qdarktheme import _color_array, _resources
+from qdarktheme._color import _HSLA, Color, _round_float
+from qdarktheme._color_array import ColorArray
+
+# Below this many accents, the fixed cost of the NumPy calls outweighs the vectorization.
+_MIN_BATCH = 128
+
+
+def _tone(lum, darken, lighten) -> float:
+    """Apply the darken and lighten steps of ``filter._transform`` to a luminance."""
+    if darken:
+        lum = _HSLA(0, 0, lum - lum * darken).lum
+    if lighten:
+        lum = _HSLA(0, 0, lum + lum * lighten).lum
+    return lum
+
+
+@lru_cache(maxsize=None)
+def _state_transforms(theme) -> tuple:
+    """Return ``(color id, transforms)`` of each primary state derived from the accent.
+
+    States set to a fixed color do not depend on the accent and are left out.
+    """
+    try:
+        primary = json.loads(_resources.colors.THEME_COLOR_VALUES[theme])["primary"]
+    except KeyError:
+        raise ValueError('invalid argument, not a dark or light: "{}"'.format(theme)) from None
+    return tuple(
+        ("primary>{}".format(state), transforms)
+        for state, transforms in primary.items()
+        if state != "base" and not isinstance(transforms, str)
+    )
+
+
+@lru_cache(maxsize=None)
+def _tonal_tables(theme) -> tuple:
+    """Return ``(color id, alpha factor, luminance table)`` of each primary state.
+
+    HSLA luminance has three decimal places, so the darken and lighten steps of a state are
+    precomputed for all 1001 luminance values.
+    """
+    tables = []
+    for id, transforms in _state_transforms(theme):
+        darken, lighten = transforms.get("darken"), transforms.get("lighten")
+        lum_table = None
+        if darken or lighten:
+            lum_table = tuple(_tone(i / 1000, darken, lighten) for i in range(1001))
+        tables.append((id, transforms.get("transparent"), lum_table))
+    return tuple(tables)
+
+
+def _accent_rows(accent, theme) -> list:
+    """Return ``(color id, r, g, b, a)`` of ``primary`` and each ``primary>state`` it derives.
+
+    The channels equal the ones ``ColorTable`` resolves for ``{"primary": accent}``. Only the
+    channels are computed, without building a Color for each state.
+    """
+    color = accent if isinstance(accent, Color) else Color.from_hex(accent)
+    rgba = color.rgba
+    rows = [("primary",) + tuple(rgba)]
+    hsla = color.hsla
+    # transparent() builds the color from RGBA, so later steps start from the HSLA of RGBA.
+    rgb_hsla = _HSLA.from_rgba(rgba)
+    for id, alpha_factor, lum_table in _tonal_tables(theme):
+        base = hsla
+        alpha = rgba.a
+        if alpha_factor:
+            base = rgb_hsla
+            alpha = _round_float(max(min(1, alpha * alpha_factor), 0))
+        if lum_table is None:
+            rows.append((id, rgba.r, rgba.g, rgba.b, alpha))
+            continue
+        rgb = colorsys.hls_to_rgb(base.hue / 360, lum_table[round(base.lum * 1000)], base.sat)
+        rows.append((id, round(rgb[0] * 255), round(rgb[1] * 255), round(rgb[2] * 255), alpha))
+    return rows
+
+
+_HEX_BYTES = tuple("{:02x}".format(byte) for byte in range(256))
+
+
+def _to_hex(r, g, b, a) -> str:
+    """Format the channels as hex, rounding alpha to the nearest of the 8 bits hex can store."""
+    hex_color = "#" + _HEX_BYTES[r] + _HEX_BYTES[g] + _HEX_BYTES[b]
+    return hex_color if a == 1 else hex_color + _HEX_BYTES[round(a * 255)]
+
+
+def accent_palette(accent, theme = "dark") -> dict:
+    """Derive ``primary`` and the ``primary>...`` colors computed from it for an accent color.
+
+    The transforms of each primary state are precomputed per theme, so this is cheap enough to
+    call on every change of a color picker, for example to preview the selection and button
+    colors of the accent. To theme with the accent, pass ``{"primary": accent}`` to
+    :func:`load_stylesheet`, which derives the same colors without the rounding of hex notation
+    and can be served pre-rendered.
+
+    Args:
+        accent: The accent color. Hex string such as ``#D0BCFF`` or Color.
+        theme: The theme name. There are `dark` and `light`.
+
+    Raises:
+        ValueError: If the arguments of this method is wrong.
+
+    Returns:
+        Map of color id to hex string of the colors derived from the accent. States set to a
+        fixed color in the theme do not depend on the accent and are left out. Hex notation
+        stores alpha in 8 bits, so alpha is rounded to the nearest multiple of 1/255.
+
+    Examples:
+        Preview an accent color picked by the user ::
+
+            accent = picker.currentColor().name()
+            palette = qdarktheme.accent_palette(accent)
+            swatch.setStyleSheet("background: {}".format(palette["primary>selection.background"]))
+            ...
+            # Once the accent is chosen.
+            app.setStyleSheet(qdarktheme.load_stylesheet(custom_colors={"primary": accent}))
+    """
+    return {id: _to_hex(r, g, b, a) for id, r, g, b, a in _accent_rows(accent, theme)}
+
+
+def accent_palettes(accents, theme = "dark") -> list:
+    """Derive the colors of :func:`accent_palette` for many accent colors at once.
+
+    For large batches, such as the swatches of a whole color wheel, each primary state is
+    computed for all the accents in one vectorized call when NumPy is installed. Small batches
+    and installs without NumPy call :func:`accent_palette` per accent. The results are the same.
+
+    Args:
+        accents: Iterable of accent colors. Hex strings such as ``#D0BCFF`` or Colors.
+        theme: The theme name. There are `dark` and `light`.
+
+    Raises:
+        ValueError: If the arguments of this method is wrong.
+
+    Returns:
+        List of the maps :func:`accent_palette` returns, in the order of ``accents``.
+    """
+    accents = list(accents)
+    states = _state_transforms(theme)
+    if _color_array.np is None or len(accents) < _MIN_BATCH:
+        return [accent_palette(accent, theme) for accent in accents]
+    colors = ColorArray([accent if isinstance(accent, Color) else Color.from_hex(accent) for accent in accents])
+    ids = ["primary"]
+    columns = [colors.rows()]
+    for id, transforms in states:
+        derived = colors
+        # The order of filter._transform.
+        for name in ("transparent", "darken", "lighten"):
+            if transforms.get(name):
+                derived = getattr(derived, name)(transforms[name])
+        ids.append(id)
+        columns.append(derived.rows())
+    hex_columns = [[_to_hex(r, g, b, a) for r, g, b, a in rows] for rows in columns]
+    return [dict(zip(ids, hex_colors)) for hex_colors in zip(*hex_columns)]
@@ -0,0 +1,123 @@
+"""Module for serving the stylesheets pre-rendered by ``tools/build_bundle.py``.
+
+The bundle file is ``MAGIC``, the byte length of the index, the JSON index and the data. Each
+variant is compressed with zlib using a shared preset dictionary and stored at an offset of the
+data, with the indexes of the svg files its urls refer to. The parts of a stylesheet that depend on the environment are kept as holes:
+
+- ``HOLE`` + JSON ``[text, env kwargs]`` + ``HOLE`` for the output of the ``env`` filter.
+- ``ROOT`` in place of the cache root directory in the urls of the ``url`` filter.
+"""
+
+import json
+import mmap
+import struct
+import zlib
+from functools import lru_cache
+from pathlib import Path
+
+from qdarktheme import __version__, _resources
+from qdarktheme._color import _RGBA, Color
+from qdarktheme._template import filter
+from qdarktheme._template.engine import _text_hash
+from qdarktheme._util import get_cash_root_path, get_logger
+
+_logger = get_logger(__name__)
+
+MAGIC = b"QDTBUNDLE1\n"
+HOLE = "\x00"
+ROOT = "\x01"
+BUNDLE_PATH = Path(__file__).parent / "_resources" / "stylesheets.bundle"
+
+
+def sources_hash() -> str:
+    """Return the hash of the sources of the stylesheets, which the bundle has to match."""
+    return _text_hash(
+        "\n".join(
+            [
+                __version__,
+                _resources.stylesheets.TEMPLATE_STYLESHEET,
+                _resources.stylesheets.TEMPLATE_STANDARD_ICONS_STYLESHEET,
+                _resources.colors.THEME_COLOR_VALUES["dark"],
+                _resources.colors.THEME_COLOR_VALUES["light"],
+            ]
+        )
+    )
+
+
+def variant_key(theme, corner_shape, custom_colors_key, with_icons) -> str:
+    """Return the key of a variant from the arguments of ``_render_stylesheet``."""
+    return "{}|{}|{}|{}".format(theme, corner_shape, custom_colors_key, int(with_icons))
+
+
+@lru_cache(maxsize=256)
+def _fill_hole(hole) -> str:
+    text, kwargs = json.loads(hole)
+    return filter.env(text, **kwargs)
+
+
+class Bundle:
+    """Memory-mapped bundle of pre-rendered stylesheets."""
+
+    def __init__(self, path) -> None:
+        """Map the bundle file and read its index.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file is not a bundle or is built from other sources.
+        """
+        with open(str(path), "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(MAGIC)] != MAGIC:
+            raise ValueError("not a stylesheet bundle: {}".format(path))
+        (index_size,) = struct.unpack_from("<I", self._map, len(MAGIC))
+        index_start = len(MAGIC) + 4
+        index = json.loads(self._map[index_start : index_start + index_size].decode("utf-8"))
+        if index["sources"] != sources_hash():
+            raise ValueError("stylesheet bundle is stale: {}".format(path))
+        self._data_start = index_start + index_size
+        self._variants = index["variants"]
+        self._svgs = index["svgs"]
+        self._checked_svgs = set()
+        self._zdict = self._read(*index["zdict"])
+
+    def _read(self, offset, length) -> bytes:
+        start = self._data_start + offset
+        return self._map[start : start + length]
+
+    def __contains__(self, key) -> bool:
+        return key in self._variants
+
+    def get(self, key):
+        """Return the stylesheet of the variant for this environment, or None if not bundled."""
+        variant = self._variants.get(key)
+        if variant is None:
+            return None
+        offset, length, svg_indexes = variant
+        decompressor = zlib.decompressobj(zdict=self._zdict)
+        text = (decompressor.decompress(self._read(offset, length)) + decompressor.flush()).decode("utf-8")
+        parts = text.split(HOLE)
+        for index in range(1, len(parts), 2):
+            parts[index] = _fill_hole(parts[index])
+
+        root = get_cash_root_path(__version__)
+        unchecked = [index for index in svg_indexes if index not in self._checked_svgs]
+        if unchecked:
+            try:
+                root.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                pass
+            for index in unchecked:
+                id, rotate, r, g, b, a = self._svgs[index]
+                filter.url(Color(_RGBA(r, g, b, a)), id, rotate)  # Writes the svg file if missing.
+                self._checked_svgs.add(index)
+        return "".join(parts).replace(ROOT, root.as_posix())
+
+
+@lru_cache(maxsize=None)
+def get_bundle():
+    """Return the Bundle shipped with qdarktheme, or None if it is missing or stale."""
+    try:
+        return Bundle(BUNDLE_PATH)
+    except (OSError, ValueError, KeyError) as e:
+        _logger.debug("Stylesheet bundle is not used: {}".format(e))
+        return None
@@ -2,6 +2,7 @@
 
 import colorsys
 import math
+from functools import lru_cache
 
 
 def _round_float(number, decimal_points = 3) -> float:
@@ -10,7 +11,9 @@ def _round_float(number, decimal_points = 3) -> float:
 
 
 class _RGBA:
-    """Class handling RGBA color code."""
+    """Class handling RGBA color code. Instances are immutable."""
+
+    __slots__ = ("_r", "_g", "_b", "_a")
 
     def __init__(self, r, g, b, a = 1) -> None:
         """Initialize rgba value.
@@ -21,25 +24,42 @@ class _RGBA:
             b: Blue(0~255).
             a: Alpha(0~1). Defaults to 1.
         """
-        self._r = min(255, max(0, r)) | 0
-        self._g = min(255, max(0, g)) | 0
-        self._b = min(255, max(0, b)) | 0
-        self._a = _round_float(max(min(1, a), 0))
+        object.__setattr__(self, "_r", min(255, max(0, r)) | 0)
+        object.__setattr__(self, "_g", min(255, max(0, g)) | 0)
+        object.__setattr__(self, "_b", min(255, max(0, b)) | 0)
+        object.__setattr__(self, "_a", _round_float(max(min(1, a), 0)))
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("_RGBA is immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (_RGBA, (self._r, self._g, self._b, self._a))
 
     def __str__(self) -> str:
         """Format RGBA class.
 
         e.g. rgba(100, 100, 100, 0.5).
         """
-        return "rgba({}, {}, {}, {:.3f})".format(self.r, self.g, self.b, self.a)
+        return "rgba({}, {}, {}, {:.3f})".format(self._r, self._g, self._b, self._a)
 
     def __getitem__(self, item):
         """Unpack to (r, g, b, a)."""
-        return [self.r, self.g, self.b, self.a][item]
+        return (self._r, self._g, self._b, self._a)[item]
 
     def __eq__(self, other) -> bool:
         """Returns true if `r`, `g`, `b` and `a` are all the same."""
-        return [self.r, self.g, self.b, self.a] == [other.r, other.g, other.b, other.a]
+        if not isinstance(other, _RGBA):
+            return NotImplemented
+        return (self._r, self._g, self._b, self._a) == (other._r, other._g, other._b, other._a)
+
+    def __hash__(self) -> int:
+        return hash((self._r, self._g, self._b, self._a))
 
     @property
     def r(self) -> int:
@@ -59,20 +79,36 @@ class _RGBA:
 
 
 class _HSLA:
+    """Class handling HSLA color code. Instances are immutable."""
+
+    __slots__ = ("_h", "_s", "_l", "_a")
+
     def __init__(self, hue, sat, lum, alpha = 1) -> None:
-        self._h = max(min(360, hue), 0) | 0
-        self._s = _round_float(max(min(1, sat), 0))
-        self._l = _round_float(max(min(1, lum), 0))
-        self._a = _round_float(max(min(1, alpha), 0))
+        object.__setattr__(self, "_h", max(min(360, hue), 0) | 0)
+        object.__setattr__(self, "_s", _round_float(max(min(1, sat), 0)))
+        object.__setattr__(self, "_l", _round_float(max(min(1, lum), 0)))
+        object.__setattr__(self, "_a", _round_float(max(min(1, alpha), 0)))
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("_HSLA is immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (_HSLA, (self._h, self._s, self._l, self._a))
 
     def __eq__(self, other) -> bool:
         """Returns true if `hue`, `sat`, `lum` and `alpha` are all the same."""
-        return [self.hue, self.sat, self.lum, self.alpha] == [
-            other.hue,
-            other.sat,
-            other.lum,
-            other.alpha,
-        ]
+        if not isinstance(other, _HSLA):
+            return NotImplemented
+        return (self._h, self._s, self._l, self._a) == (other._h, other._s, other._l, other._a)
+
+    def __hash__(self) -> int:
+        return hash((self._h, self._s, self._l, self._a))
 
     @property
     def hue(self) -> int:
@@ -101,16 +137,55 @@ class _HSLA:
 
 
 class Color:
-    """Class handling color code(RGBA and HSLA)."""
+    """Class handling color code(RGBA and HSLA).
+
+    Instances are immutable values. They compare and hash by the RGBA value, packed into one
+    integer, and by the source HSLA of colors built from HSLA, since ``lighten`` and ``darken``
+    read it and it can differ from the HSLA converted back from the RGBA. HSLA and string forms
+    are computed on first use and cached.
+    """
+
+    __slots__ = ("_rgba", "_hsla", "_key", "_str", "_hex")
 
     def __init__(self, color_code) -> None:
         """Initialize color code."""
-        self._hsla, self._hsva = None, None
         if isinstance(color_code, _RGBA):
-            self._rgba = color_code
+            rgba, hsla = color_code, None
         elif isinstance(color_code, _HSLA):
-            self._hsla = color_code
-            self._rgba = self._hsla.to_rgba()
+            # Keep the source HSLA. Transforms use it instead of converting back from RGBA.
+            rgba, hsla = color_code.to_rgba(), color_code
+        else:
+            raise TypeError("color_code must be _RGBA or _HSLA, not {}".format(type(color_code).__name__))
+        object.__setattr__(self, "_rgba", rgba)
+        object.__setattr__(self, "_hsla", hsla)
+        packed = ((rgba.r << 16 | rgba.g << 8 | rgba.b) << 10) | round(rgba.a * 1000)
+        object.__setattr__(self, "_key", packed if hsla is None else (packed, hsla))
+        object.__setattr__(self, "_str", None)
+        object.__setattr__(self, "_hex", None)
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("Color is immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (Color, (self._rgba if type(self._key) is int else self._hsla,))
+
+    def __eq__(self, other) -> bool:
+        """Returns true if the RGBA values and the source HSLA values are the same."""
+        if not isinstance(other, Color):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __repr__(self) -> str:
+        return "Color({})".format(self)
 
     @property
     def rgba(self) -> _RGBA:
@@ -120,14 +195,18 @@ class Color:
     @property
     def hsla(self) -> _HSLA:
         """Return hsla."""
-        return self._hsla if self._hsla else _HSLA.from_rgba(self.rgba)
+        if self._hsla is None:
+            object.__setattr__(self, "_hsla", _HSLA.from_rgba(self._rgba))
+        return self._hsla
 
     def __str__(self) -> str:
         """Format Color class.
 
         e.g. rgba(100, 100, 100, 0.5).
         """
-        return str(self.rgba)
+        if self._str is None:
+            object.__setattr__(self, "_str", str(self._rgba))
+        return self._str
 
     @staticmethod
     def _check_hex_format(hex_format) -> None:
@@ -146,14 +225,16 @@ class Color:
             ) from None
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def from_rgba(r, g, b, a):
-        """Convert rgba to Color object."""
+        """Convert rgba to Color object. Colors are interned, so equal arguments share one object."""
         rgba = _RGBA(r, g, b, a / 255)
         return Color(rgba)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def from_hex(hex):
-        """Convert hex string to Color object.
+        """Convert hex string to Color object. Colors are interned, so equal hex share one object.
 
         Args:
             color_hex: Color hex string.
@@ -188,11 +269,13 @@ class Color:
         Returns:
             str: Hex converted from Color object.
         """
-        r, g, b, a = self.rgba.r, self.rgba.g, self.rgba.b, self.rgba.a
-        hex_color = "{:02x}{:02x}{:02x}".format(math.floor(r), math.floor(g), math.floor(b))
-        if a != 1:
-            hex_color += "{:02x}".format(math.floor(a * 255))
-        return hex_color
+        if self._hex is None:
+            r, g, b, a = self._rgba
+            hex_color = "{:02x}{:02x}{:02x}".format(math.floor(r), math.floor(g), math.floor(b))
+            if a != 1:
+                hex_color += "{:02x}".format(math.floor(a * 255))
+            object.__setattr__(self, "_hex", hex_color)
+        return self._hex
 
     def to_hex_argb(self) -> str:
         """Convert Color object to hex(#AARRGGBB).
@@ -224,16 +307,29 @@ class Color:
 
     def lighten(self, factor):
         """Lighten color."""
-        return Color(
-            _HSLA(self.hsla.hue, self.hsla.sat, self.hsla.lum + self.hsla.lum * factor, self.hsla.alpha)
-        )
+        return _lighten(self.hsla, factor)
 
     def darken(self, factor):
         """Darken color."""
-        return Color(
-            _HSLA(self.hsla.hue, self.hsla.sat, self.hsla.lum - self.hsla.lum * factor, self.hsla.alpha)
-        )
+        return _darken(self.hsla, factor)
 
     def transparent(self, factor):
         """Make color transparent."""
-        return Color(_RGBA(self.rgba.r, self.rgba.g, self.rgba.b, self.rgba.a * factor))
+        return _transparent(self._rgba, factor)
+
+
+# Transforms are memoized by the value they read. lighten and darken read the HSLA, which can
+# differ between colors with the same RGBA, so they are keyed by the HSLA instead of the Color.
+@lru_cache(maxsize=1024)
+def _lighten(hsla, factor) -> Color:
+    return Color(_HSLA(hsla.hue, hsla.sat, hsla.lum + hsla.lum * factor, hsla.alpha))
+
+
+@lru_cache(maxsize=1024)
+def _darken(hsla, factor) -> Color:
+    return Color(_HSLA(hsla.hue, hsla.sat, hsla.lum - hsla.lum * factor, hsla.alpha))
+
+
+@lru_cache(maxsize=1024)
+def _transparent(rgba, factor) -> Color:
+    return Color(_RGBA(rgba.r, rgba.g, rgba.b, rgba.a * factor))
@@ -0,0 +1,178 @@
+"""Module for transforming many colors at once."""
+
+import colorsys
+import math
+
+from qdarktheme._color import Color
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _np_round_float(number):
+    """Vectorized ``_color._round_float``."""
+    return np.round(number * 1000) / 1000
+
+
+def _np_rgb_to_hsla(r, g, b, a):
+    """Vectorized ``_HSLA.from_rgba``, following the operations of ``colorsys.rgb_to_hls``."""
+    r, g, b = r / 255, g / 255, b / 255
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    lum = sumc / 2.0
+    gray = minc == maxc
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sat = np.where(lum <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+    hue = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    hue = np.mod(hue / 6.0, 1.0)
+    hue = np.where(gray, 0.0, hue)
+    sat = np.where(gray, 0.0, sat)
+    return (
+        np.clip(np.trunc(hue * 360).astype(np.int64), 0, 360),
+        _np_round_float(np.clip(sat, 0, 1)),
+        _np_round_float(np.clip(lum, 0, 1)),
+        a,
+    )
+
+
+def _np_v(m1, m2, hue):
+    hue = np.mod(hue, 1.0)
+    return np.select(
+        [hue < colorsys.ONE_SIXTH, hue < 0.5, hue < colorsys.TWO_THIRD],
+        [m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (colorsys.TWO_THIRD - hue) * 6.0],
+        m1,
+    )
+
+
+def _np_hsla_to_rgb(h, s, l):  # noqa: E741
+    """Vectorized ``_HSLA.to_rgba`` without alpha, following ``colorsys.hls_to_rgb``."""
+    hue = h / 360
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))
+    m1 = 2.0 * l - m2
+    gray = s == 0.0
+    channels = (
+        np.where(gray, l, _np_v(m1, m2, hue + colorsys.ONE_THIRD)),
+        np.where(gray, l, _np_v(m1, m2, hue)),
+        np.where(gray, l, _np_v(m1, m2, hue - colorsys.ONE_THIRD)),
+    )
+    return tuple(np.clip(np.round(channel * 255), 0, 255).astype(np.int64) for channel in channels)
+
+
+class ColorArray:
+    """N colors held as arrays, transformed in one vectorized call.
+
+    Results are bit-identical to transforming each :class:`Color` on its own. Without NumPy,
+    the same API falls back to a list of :class:`Color`.
+    """
+
+    def __init__(self, colors, use_numpy=None) -> None:
+        """Initialize color array.
+
+        Args:
+            colors: Iterable of Color.
+            use_numpy: Whether to use NumPy. Defaults to using it when it is installed.
+        """
+        colors = list(colors)
+        self._numpy = np is not None if use_numpy is None else use_numpy
+        if not self._numpy:
+            self._colors = colors
+            return
+        if np is None:
+            raise ImportError("NumPy is required for ColorArray(use_numpy=True).")
+        rgba = np.array([tuple(c.rgba) for c in colors], dtype=np.float64).reshape(-1, 4)
+        self._rgba = tuple(rgba[:, i].astype(np.int64) for i in range(3)) + (rgba[:, 3],)
+        h, s, l, _ = _np_rgb_to_hsla(*self._rgba)  # noqa: E741
+        alpha = rgba[:, 3].copy()
+        # Transforms read the HSLA a color keeps, as Color does. A cached HSLA equals the converted one.
+        for index, color in enumerate(colors):
+            hsla = color._hsla
+            if hsla is not None:
+                h[index], s[index], l[index], alpha[index] = hsla.hue, hsla.sat, hsla.lum, hsla.alpha
+        self._hsla = (h, s, l, alpha)
+
+    @staticmethod
+    def from_hex(hex_colors, use_numpy=None):
+        """Convert hex strings to ColorArray."""
+        return ColorArray((Color.from_hex(hex) for hex in hex_colors), use_numpy)
+
+    @staticmethod
+    def _from_arrays(rgba, hsla):
+        color_array = ColorArray.__new__(ColorArray)
+        color_array._numpy = True
+        color_array._rgba = rgba
+        color_array._hsla = hsla
+        return color_array
+
+    def __len__(self) -> int:
+        """Return the number of colors."""
+        return len(self._colors) if not self._numpy else len(self._rgba[0])
+
+    def _factors(self, factor):
+        """Broadcast ``factor``, a number or a sequence with one factor per color."""
+        if isinstance(factor, (int, float)):
+            return [factor] * len(self)
+        factors = list(factor)
+        if len(factors) != len(self):
+            raise ValueError("expected {} factors, got {}".format(len(self), len(factors)))
+        return factors
+
+    def _change_lum(self, factor, sign):
+        factors = self._factors(factor)
+        if not self._numpy:
+            method = Color.lighten if sign > 0 else Color.darken
+            return ColorArray([method(c, f) for c, f in zip(self._colors, factors)], use_numpy=False)
+        h, s, l, a = self._hsla  # noqa: E741
+        factors = np.array(factors, dtype=np.float64)
+        new_l = l + l * factors if sign > 0 else l - l * factors
+        hsla = (h, s, _np_round_float(np.clip(new_l, 0, 1)), a)
+        r, g, b = _np_hsla_to_rgb(*hsla[:3])
+        return ColorArray._from_arrays((r, g, b, a), hsla)
+
+    def lighten(self, factor):
+        """Lighten colors. ``factor`` is a number or one factor per color."""
+        return self._change_lum(factor, 1)
+
+    def darken(self, factor):
+        """Darken colors. ``factor`` is a number or one factor per color."""
+        return self._change_lum(factor, -1)
+
+    def transparent(self, factor):
+        """Make colors transparent. ``factor`` is a number or one factor per color."""
+        factors = self._factors(factor)
+        if not self._numpy:
+            return ColorArray([c.transparent(f) for c, f in zip(self._colors, factors)], use_numpy=False)
+        r, g, b, a = self._rgba
+        a = _np_round_float(np.clip(a * np.array(factors, dtype=np.float64), 0, 1))
+        return ColorArray._from_arrays((r, g, b, a), _np_rgb_to_hsla(r, g, b, a))
+
+    def rows(self) -> list:
+        """Return ``(r, g, b, a)`` of each color as Python numbers."""
+        if not self._numpy:
+            return [tuple(c.rgba) for c in self._colors]
+        r, g, b, a = (channel.tolist() for channel in self._rgba)
+        return list(zip(r, g, b, a))
+
+    def to_rgba_strings(self) -> list:
+        """Format colors like ``str(Color)``, e.g. rgba(100, 100, 100, 0.500)."""
+        return ["rgba({}, {}, {}, {:.3f})".format(*row) for row in self.rows()]
+
+    def to_hex(self) -> list:
+        """Format colors like ``Color._to_hex``, e.g. 646464 or 64646480."""
+        return [
+            "{:02x}{:02x}{:02x}".format(r, g, b) + ("" if a == 1 else "{:02x}".format(math.floor(a * 255)))
+            for r, g, b, a in self.rows()
+        ]
+
+    def to_hex_argb(self) -> list:
+        """Format colors like ``Color.to_hex_argb``, e.g. 646464 or 80646464."""
+        return [
+            ("" if a == 1 else "{:02x}".format(math.floor(a * 255))) + "{:02x}{:02x}{:02x}".format(r, g, b)
+            for r, g, b, a in self.rows()
+        ]
@@ -0,0 +1,59 @@
+"""Module for theme colors resolved to their final values."""
+
+from qdarktheme._template import filter
+
+
+class ColorTable:
+    """Every color id and state of a theme resolved to its final Color.
+
+    Keys are color ids such as ``background`` and ``id:state`` such as ``background:popup``.
+    ``replacements`` has the same nesting as the theme color values with Color objects in place
+    of hex strings and transforms, so the ``color`` filter only looks them up.
+    """
+
+    def __init__(self, color_values, base=None) -> None:
+        """Resolve every color id and state of ``color_values``.
+
+        Args:
+            color_values: The theme color values.
+            base: ColorTable of values ``color_values`` is an overlay of. The ids whose value is
+                the same object as in ``base`` reuse its Colors instead of resolving them again.
+        """
+        self._values = color_values
+        self._colors = {}
+        self.replacements = {}
+        for id, color_info in color_values.items():
+            if base is not None and base._values.get(id) is color_info:
+                resolved = self.replacements[id] = base.replacements[id]
+                if isinstance(color_info, str):
+                    self._colors[id] = resolved
+                else:
+                    for state, color in resolved.items():
+                        self._colors[id if state == "base" else "{}:{}".format(id, state)] = color
+                continue
+            if isinstance(color_info, str):
+                self.replacements[id] = self._colors[id] = filter.color(color_info)
+                continue
+            resolved = self.replacements[id] = {}
+            for state in color_info:
+                color = filter.color(color_info, None if state == "base" else state)
+                resolved[state] = color
+                self._colors[id if state == "base" else "{}:{}".format(id, state)] = color
+        self.strings = {key: str(color) for key, color in self._colors.items()}
+
+    def __getitem__(self, key):
+        """Return the Color of ``id`` or ``id:state``."""
+        return self._colors[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._colors
+
+    def __iter__(self):
+        return iter(self._colors)
+
+    def __len__(self) -> int:
+        return len(self._colors)
+
+    def items(self):
+        """Return ``(key, Color)`` pairs."""
+        return self._colors.items()
@@ -0,0 +1,199 @@
+"""Module for auditing the contrast of the text colors used by the stylesheet template."""
+
+import re
+from functools import lru_cache
+
+from qdarktheme import _resources
+from qdarktheme._template import filter
+from qdarktheme._template.engine import Template
+
+_PLACEHOLDER = r"\{\{[^{}]*\}\}"
+_RULE_RE = re.compile(r"((?:[^{{}}]|{0})*?)\{{((?:[^{{}}]|{0})*)\}}".format(_PLACEHOLDER))
+_DECLARATION_RE = re.compile(r"([\w-]+)\s*:\s*((?:[^;{{}}]|{})*)".format(_PLACEHOLDER))
+_PSEUDO_STATE_RE = re.compile(r"(?<!:):[!\w-]+$")
+_SUBCONTROL_RE = re.compile(r"::[\w-]+$")
+_COMBINATOR_RE = re.compile(r"\s*>?\s*[^\s>]+$")
+_SELECTOR_SEPARATOR_RE = re.compile(r",(?![^{}]*\}\})")
+
+# Text properties and the background properties the text is drawn on.
+_PAIRS = {
+    "color": ("background", "background-color"),
+    "selection-color": ("selection-background-color",),
+}
+# Subcontrols that draw text. Rules of other subcontrols only declaring a background, such as
+# ``::handle``, are not paired with the inherited text color.
+_TEXT_SUBCONTROLS = {"item", "tab", "section", "title"}
+# Widgets without text.
+_NON_TEXT_WIDGETS = {"QScrollBar", "QSlider", "QSplitter", "QColumnViewGrip", "QSizeGrip", "QProgressBar"}
+
+
+def _color_key(value):
+    """Return the color table key of a ``{{id|color(state=...)}}`` value or None for literals."""
+    value = value.strip()
+    if not re.fullmatch(_PLACEHOLDER, value):
+        return None
+    contents, *filter_texts = value.strip("{}").replace(" ", "").split("|")
+    if len(filter_texts) != 1:
+        return None
+    name, kwargs = Template._parse_filter(filter_texts[0])
+    if name != "color":
+        return None
+    id = Template._to_py_value(contents)
+    state = kwargs.get("state")
+    return id if state is None else "{}:{}".format(id, state)
+
+
+def _parents(selector):
+    """Yield the selectors ``selector`` inherits colors from, nearest first, ending at QWidget."""
+    while True:
+        for pattern in (_PSEUDO_STATE_RE, _SUBCONTROL_RE, _COMBINATOR_RE):
+            parent = pattern.sub("", selector)
+            if parent != selector:
+                break
+        if parent == selector or not parent:
+            break
+        selector = parent
+        yield selector
+    if selector != "QWidget":
+        yield "QWidget"
+
+
+def _draws_text(selector) -> bool:
+    compound = re.split(r"[\s>]+", selector)[-1]
+    widget = re.split(r"[:\[]", compound.lstrip("."), 1)[0]
+    subcontrol = re.search(r"::([\w-]+)", compound)
+    return widget not in _NON_TEXT_WIDGETS and (subcontrol is None or subcontrol.group(1) in _TEXT_SUBCONTROLS)
+
+
+@lru_cache(maxsize=8)
+def template_color_pairs(template_text) -> tuple:
+    """Return the foreground/background pairs the template draws text with.
+
+    Declarations are read per selector. A side the rule does not declare, or declares with a
+    literal such as ``transparent``, is inherited from the selector without its last pseudo-state,
+    subcontrol or compound, and finally from ``QWidget``.
+
+    Args:
+        template_text: Stylesheet template text.
+
+    Returns:
+        ``(selector, text property, foreground key, background key)`` of each pair, with the keys
+        of :class:`ColorTable` such as ``foreground`` and ``primary:list.selectionBackground``.
+    """
+    rules = []
+    declared = {}
+    for match in _RULE_RE.finditer(template_text):
+        properties = {
+            name: _color_key(value)
+            for name, value in _DECLARATION_RE.findall(match.group(2))
+            if name in _PAIRS or any(name in backgrounds for backgrounds in _PAIRS.values())
+        }
+        properties = {name: key for name, key in properties.items() if key is not None}
+        for selector in _SELECTOR_SEPARATOR_RE.split(match.group(1)):
+            selector = selector.strip()
+            if "{{" in selector:
+                # Resolve the Qt binding specific attribute selectors.
+                selector = Template(selector, {"env": filter.env}).render({})
+            declared.setdefault(selector, {}).update(properties)
+            if properties:
+                rules.append((selector, properties))
+
+    def lookup(selector, names):
+        for candidate in (selector,) + tuple(_parents(selector)):
+            for name in names:
+                key = declared.get(candidate, {}).get(name)
+                if key is not None:
+                    return key
+        return None
+
+    pairs = []
+    for selector, properties in rules:
+        for text_property, backgrounds in _PAIRS.items():
+            has_text = text_property in properties
+            has_background = any(name in properties for name in backgrounds)
+            if not has_text and not (has_background and _draws_text(selector)):
+                continue
+            foreground = lookup(selector, (text_property,))
+            background = lookup(selector, backgrounds)
+            if foreground is not None and background is not None:
+                pair = (selector, text_property, foreground, background)
+                if pair not in pairs:
+                    pairs.append(pair)
+    return tuple(pairs)
+
+
+def _relative_luminance(rgb) -> float:
+    channels = [c / 255 for c in rgb]
+    r, g, b = (c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4 for c in channels)
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+def _composite(color, backdrop) -> tuple:
+    """Blend ``color`` over the opaque ``backdrop`` and return the rgb."""
+    r, g, b, a = color.rgba
+    return tuple(c * a + d * (1 - a) for c, d in zip((r, g, b), backdrop))
+
+
+def contrast_ratio(foreground, background, backdrop = None) -> float:
+    """Return the WCAG contrast ratio of two Colors, from 1 to 21.
+
+    Translucent colors are blended: ``background`` over ``backdrop`` (white if None), then
+    ``foreground`` over the result.
+    """
+    backdrop_rgb = (255, 255, 255) if backdrop is None else tuple(backdrop.rgba)[:3]
+    background_rgb = _composite(background, backdrop_rgb)
+    lighter, darker = sorted(
+        (_relative_luminance(_composite(foreground, background_rgb)), _relative_luminance(background_rgb)),
+        reverse=True,
+    )
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+class ContrastIssue:
+    """A text color whose contrast on its background is below the required ratio.
+
+    Attributes:
+        selector: The selector drawing the text.
+        property: ``color`` or ``selection-color``.
+        foreground: Color table key of the text color.
+        background: Color table key of the background.
+        ratio: The contrast ratio.
+    """
+
+    __slots__ = ("selector", "property", "foreground", "background", "ratio")
+
+    def __init__(self, selector, property, foreground, background, ratio) -> None:
+        """Initialize ContrastIssue class."""
+        self.selector = selector
+        self.property = property
+        self.foreground = foreground
+        self.background = background
+        self.ratio = ratio
+
+    def __repr__(self) -> str:
+        return "ContrastIssue({!r}, {!r}, {!r} on {!r}, {:.2f})".format(
+            self.selector, self.property, self.foreground, self.background, self.ratio
+        )
+
+
+def audit_color_table(color_table, min_ratio = 4.5, include_disabled = False) -> list:
+    """Return the ContrastIssue of each pair of the stylesheet template below ``min_ratio``.
+
+    Translucent backgrounds are blended over the theme ``background`` color. Each distinct pair
+    of colors is computed once.
+    """
+    backdrop = color_table["background"]
+    ratios = {}
+    issues = []
+    for selector, text_property, foreground, background in template_color_pairs(
+        _resources.stylesheets.TEMPLATE_STYLESHEET
+    ):
+        if not include_disabled and ":disabled" in selector:
+            continue
+        colors = (color_table[foreground], color_table[background])
+        ratio = ratios.get(colors)
+        if ratio is None:
+            ratio = ratios[colors] = contrast_ratio(*colors, backdrop)
+        if ratio < min_ratio:
+            issues.append(ContrastIssue(selector, text_property, foreground, background, ratio))
+    return issues
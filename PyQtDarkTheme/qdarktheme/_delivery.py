@@ -0,0 +1,57 @@
+"""Module for delivering stylesheets rendered on worker threads to the GUI thread."""
+
+from qdarktheme._util import get_logger
+from qdarktheme.qtpy.QtCore import QObject, Qt, Signal, Slot
+
+_logger = get_logger(__name__)
+
+_SERIAL_PROPERTY = "_qdarktheme_stylesheet_serial"
+
+
+class StylesheetDelivery(QObject):
+    """Set the stylesheet of a future to the target on the thread the target lives in.
+
+    The done callback of the future emits a signal from the worker thread. The connection is
+    queued, so the slot runs in the thread of this object, which is the thread of the target.
+    """
+
+    _done = Signal(object)
+
+    def __init__(self, target, future, callback=None):
+        """Initialize StylesheetDelivery class.
+
+        Args:
+            target: QApplication or QWidget to call ``setStyleSheet`` of.
+            future: ``concurrent.futures.Future`` of the stylesheet.
+            callback: Function called with the stylesheet after it is set.
+        """
+        # The target owns this object until the stylesheet is delivered.
+        super().__init__(target)
+        self._target = target
+        self._callback = callback
+        self._serial = (target.property(_SERIAL_PROPERTY) or 0) + 1
+        target.setProperty(_SERIAL_PROPERTY, self._serial)
+        self._done.connect(self._deliver, Qt.ConnectionType.QueuedConnection)
+        future.add_done_callback(self._emit)
+
+    def _emit(self, future) -> None:
+        try:
+            self._done.emit(future)
+        except RuntimeError:
+            pass  # The target was deleted before the stylesheet was rendered.
+
+    @Slot(object)
+    def _deliver(self, future) -> None:
+        try:
+            if self._target.property(_SERIAL_PROPERTY) != self._serial:
+                return  # A later stylesheet was requested for the target.
+            try:
+                stylesheet = future.result()
+            except Exception as e:  # noqa: PIE786
+                _logger.warning("Failed to render the stylesheet: {}".format(e))
+                return
+            self._target.setStyleSheet(stylesheet)
+            if self._callback is not None:
+                self._callback(stylesheet)
+        finally:
+            self.deleteLater()
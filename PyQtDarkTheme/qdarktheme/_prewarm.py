@@ -0,0 +1,115 @@
+"""Module for rendering the likely next stylesheets on a worker thread."""
+
+import copy
+import os
+import sys
+import threading
+
+from qdarktheme._util import get_logger
+
+_logger = get_logger(__name__)
+
+
+def _lower_priority() -> None:
+    """Lower the scheduling priority of the current thread where the OS has per-thread nice."""
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError):
+        pass
+
+
+class Prewarmer:
+    """Render the neighbours of the last loaded stylesheet into the in-process cache.
+
+    Each :meth:`schedule` cancels the pending variants of the previous one. The worker waits
+    ``delay`` seconds before each variant, so bursts of loads do not start renders and the GUI
+    thread gets the interpreter between them.
+    """
+
+    def __init__(self, render, accents=None, delay=0.05) -> None:
+        """Initialize Prewarmer class.
+
+        Args:
+            render: Function taking ``(theme, corner_shape, custom_colors, with_icons)``.
+            accents: Accent colors in the order they are offered, either one sequence or a map of
+                theme name to sequence. A map of color name to color can be given for sequence.
+            delay: Seconds to wait before rendering each variant.
+        """
+        self._render = render
+        self._accents = accents
+        self._delay = delay
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._last = None
+
+    def _accent_list(self, theme) -> list:
+        accents = self._accents
+        if isinstance(accents, dict) and theme in accents:
+            accents = accents[theme]
+        if isinstance(accents, dict):
+            return [accent for accent in accents.values() if isinstance(accent, str)]
+        return list(accents or ())
+
+    def neighbours(self, theme, corner_shape, custom_colors, with_icons) -> list:
+        """Return the arguments of the likely next variants, most likely first.
+
+        Those are the opposite theme, the other corner shape and the accents next to the current
+        one. An accent switched to the opposite theme keeps its position in the accent list.
+        """
+        other_theme = "light" if theme == "dark" else "dark"
+        other_corner_shape = "sharp" if corner_shape == "rounded" else "rounded"
+        accents = self._accent_list(theme)
+        position = None
+        if isinstance(custom_colors, dict) and list(custom_colors) == ["primary"]:
+            accent = custom_colors["primary"]
+            lowered = [a.lower() for a in accents]
+            if isinstance(accent, str) and accent.lower() in lowered:
+                position = lowered.index(accent.lower())
+        other_accents = self._accent_list(other_theme)
+        other_theme_colors = custom_colors
+        if position is not None and position < len(other_accents):
+            other_theme_colors = {"primary": other_accents[position]}
+        variants = [
+            (other_theme, corner_shape, other_theme_colors, with_icons),
+            (theme, other_corner_shape, custom_colors, with_icons),
+        ]
+        if position is not None:
+            variants += [
+                (theme, corner_shape, {"primary": accents[index]}, with_icons)
+                for index in (position - 1, position + 1)
+                if 0 <= index < len(accents)
+            ]
+        return variants
+
+    def schedule(self, theme, corner_shape, custom_colors, with_icons) -> None:
+        """Start rendering the neighbours of the variant, cancelling the previous schedule."""
+        # The worker must not see later changes of the caller's dict.
+        variant = (theme, corner_shape, copy.deepcopy(custom_colors), with_icons)
+        with self._lock:
+            if variant == self._last:
+                return
+            self._last = variant
+            self._cancel.set()
+            self._cancel = cancel = threading.Event()
+        thread = threading.Thread(
+            target=self._run, args=(self.neighbours(*variant), cancel), name="qdarktheme-prewarm", daemon=True
+        )
+        thread.start()
+
+    def cancel(self) -> None:
+        """Cancel the variants not rendered yet."""
+        with self._lock:
+            self._last = None
+            self._cancel.set()
+
+    def _run(self, variants, cancel) -> None:
+        _lower_priority()
+        for variant in variants:
+            if cancel.wait(self._delay):
+                return
+            try:
+                self._render(*variant)
+            except Exception as e:  # noqa: PIE786
+                _logger.debug("Failed to pre-render {}: {}".format(variant, e))
@@ -0,0 +1,183 @@
+"""Module for handling rendered Qt stylesheets rule by rule."""
+
+import re
+
+_RULE_RE = re.compile(r"([^{}]*)\{([^{}]*)\}")
+
+
+def parse_rules(stylesheet) -> list:
+    """Split the stylesheet into ``(selector, body)`` pairs in source order.
+
+    Args:
+        stylesheet: Qt stylesheet text such as the output of ``load_stylesheet``.
+
+    Returns:
+        List of ``(selector, body)``. ``body`` is the text between the braces.
+    """
+    return [(match.group(1).strip(), match.group(2)) for match in _RULE_RE.finditer(stylesheet)]
+
+
+def format_rules(rules) -> str:
+    """Join ``(selector, body)`` pairs back to stylesheet text."""
+    return "".join("{} {{{}}}".format(selector, body) for selector, body in rules)
+
+
+def _index_rules(rules) -> dict:
+    """Key the rules by selector and occurrence, since a selector can appear more than once."""
+    indexed = {}
+    occurrences = {}
+    for selector, body in rules:
+        occurrence = occurrences[selector] = occurrences.get(selector, -1) + 1
+        indexed[(selector, occurrence)] = body
+    return indexed
+
+
+class RuleDiff:
+    """Rule-level difference between two rendered stylesheets.
+
+    Attributes:
+        changed: ``(selector, old body, new body)`` of rules whose body changed.
+        added: ``(selector, body)`` of rules only in the new stylesheet.
+        removed: ``(selector, body)`` of rules only in the old stylesheet.
+    """
+
+    def __init__(self, old_stylesheet, new_stylesheet):
+        """Compare the rules of ``old_stylesheet`` and ``new_stylesheet``."""
+        old_rules = _index_rules(parse_rules(old_stylesheet))
+        new_rules = _index_rules(parse_rules(new_stylesheet))
+        self.changed = []
+        self.added = []
+        for key, body in new_rules.items():
+            if key not in old_rules:
+                self.added.append((key[0], body))
+            elif old_rules[key] != body:
+                self.changed.append((key[0], old_rules[key], body))
+        self.removed = [(key[0], body) for key, body in old_rules.items() if key not in new_rules]
+        self._old_count = len(old_rules)
+        self._new_count = len(new_rules)
+
+    def __bool__(self) -> bool:
+        """Return true if the stylesheets differ."""
+        return bool(self.changed or self.added or self.removed)
+
+    def stylesheet(self) -> str:
+        """Return the new form of the changed and added rules as stylesheet text."""
+        return format_rules(
+            [(selector, body) for selector, _, body in self.changed] + self.added
+        )
+
+    def metrics(self) -> dict:
+        """Return the counts of rules in each stylesheet and of the differing rules."""
+        differing = len(self.changed) + len(self.added) + len(self.removed)
+        return {
+            "old_rules": self._old_count,
+            "new_rules": self._new_count,
+            "changed": len(self.changed),
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "unchanged": self._new_count - len(self.changed) - len(self.added),
+            "changed_ratio": differing / max(self._old_count, self._new_count, 1),
+        }
+
+
+def _declarations(body) -> list:
+    """Return ``(property, declaration)`` of the body without empty and overridden declarations."""
+    declarations = {}
+    for declaration in body.split(";"):
+        declaration = declaration.strip()
+        if declaration:
+            name = declaration.split(":", 1)[0].strip().lower()
+            # Re-inserted so that the declaration keeps the position of the last one.
+            declarations.pop(name, None)
+            declarations[name] = declaration
+    return list(declarations.items())
+
+
+def _property_family(name) -> str:
+    """Return the shorthand a property belongs to, such as ``border`` of ``border-top-color``."""
+    return name.split("-", 1)[0]
+
+
+class OptimizedStylesheet:
+    """Rendered stylesheet with its waste removed.
+
+    The rules are rewritten in three ways:
+
+    - Rules without declarations, such as rules whose declarations the ``env`` filter removed for
+      this Qt version, are dropped. Empty rules can be written on purpose, though: a ``:hover``
+      rule matching a widget makes Qt enable hover events on it, which some widgets need to
+      repaint on hover. So empty rules with a selector in ``keep_empty`` or with a ``:hover``
+      pseudo-state are kept.
+    - Declarations overridden later in the same rule are dropped.
+    - The selectors of a rule are moved into an earlier rule with the same declarations, if no
+      rule between them declares a property of the same shorthand family.
+
+    Attributes:
+        stylesheet: The optimized stylesheet text.
+    """
+
+    def __init__(self, stylesheet, keep_empty=()):
+        """Optimize the rendered ``stylesheet``.
+
+        Args:
+            stylesheet: The rendered stylesheet text.
+            keep_empty: Selectors of the rules that are empty on purpose, such as the rules
+                written without declarations in the template.
+        """
+        keep_empty = frozenset(keep_empty)
+        rules = parse_rules(stylesheet)
+        self._old_bytes = len(stylesheet.encode("utf-8"))
+        self._old_rules = len(rules)
+        self._empty_rules = 0
+        self._merged_rules = 0
+        self._shadowed_declarations = 0
+
+        optimized = []  # [selectors, body]
+        last_rule_of_body = {}
+        last_rule_of_family = {}
+        for selector, body in rules:
+            declarations = _declarations(body)
+            declared = [declaration for declaration in body.split(";") if declaration.strip()]
+            self._shadowed_declarations += len(declared) - len(declarations)
+            selectors = [part.strip() for part in selector.split(",")]
+            if not declarations:
+                if any(part in keep_empty or ":hover" in part for part in selectors):
+                    # Not a merge target, since Qt only needs the selectors to match.
+                    optimized.append([selectors, ""])
+                else:
+                    self._empty_rules += 1
+                continue
+            body = ";".join(declaration for _, declaration in declarations)
+            families = {_property_family(name) for name, _ in declarations}
+            index = last_rule_of_body.get(body)
+            if index is not None and all(
+                last_rule_of_family.get(family, -1) <= index for family in families
+            ):
+                merged = optimized[index][0]
+                merged.extend(part for part in selectors if part not in merged)
+                self._merged_rules += 1
+                continue
+            index = last_rule_of_body[body] = len(optimized)
+            optimized.append([selectors, body])
+            for family in families:
+                last_rule_of_family[family] = index
+
+        self.stylesheet = format_rules((",".join(selectors), body) for selectors, body in optimized)
+        self._new_rules = len(optimized)
+
+    def __str__(self) -> str:
+        return self.stylesheet
+
+    def metrics(self) -> dict:
+        """Return the sizes before and after the optimization and the counts of each rewrite."""
+        new_bytes = len(self.stylesheet.encode("utf-8"))
+        return {
+            "old_bytes": self._old_bytes,
+            "new_bytes": new_bytes,
+            "saved_bytes": self._old_bytes - new_bytes,
+            "old_rules": self._old_rules,
+            "new_rules": self._new_rules,
+            "empty_rules": self._empty_rules,
+            "merged_rules": self._merged_rules,
+            "shadowed_declarations": self._shadowed_declarations,
+        }
@@ -7,6 +7,6 @@ Created by the `PyQtDarkTheme/tools/build_styles`.
 
 """
 
-from qdarktheme._resources import colors, palette, stylesheets, svg
+from qdarktheme._resources import colors, palette, plans, stylesheets, svg
 
 THEMES = ("dark", "light", "auto")
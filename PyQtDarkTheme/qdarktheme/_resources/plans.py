@@ -0,0 +1,24 @@
+"""Render plans of the template stylesheets.
+
+**Warning**
+
+This module created programmatically. All changes made in this file will be lost!
+Created by the `PyQtDarkTheme/tools/build_plans.py`.
+
+"""
+
+TEMPLATE_STYLESHEET_PLAN = {
+    'hash': '41f3e46d1bde57e493dfee50d9dca966c9624b2b',
+    'literals': ((0, 20), (40, 47), (67, 84), (104, 132), (179, 204), (242, 270), (327, 344), (382, 713), (733, 790), (806, 879), (896, 918), (953, 960), (980, 1043), (1073, 1173), (1204, 1279), (1318, 1385), (1425, 1579), (1596, 1678), (1709, 1729), (1745, 1933), (1949, 1961), (1981, 2084), (2115, 2129), (2166, 2309), (2337, 2402), (2461, 2507), (2576, 2621), (2684, 2727), (2800, 2833), (2849, 3032), (3063, 3149), (3182, 3244), (3275, 3305), (3336, 3473), (3507, 3575), (3610, 3625), (3719, 3720), (3815, 3834), (3869, 3884), (3978, 3979), (4074, 4128), (4144, 4208), (4247, 4380), (4438, 4474), (4536, 4560), (4590, 4605), (4636, 4639), (4691, 4727), (4768, 4801), (4841, 4873), (4909, 4924), (4955, 4995), (5036, 5076), (5118, 5159), (5203, 5265), (5304, 5358), (5397, 5458), (5497, 5549), (5588, 5721), (5767, 5804), (5864, 5904), (5974, 6013), (6084, 6123), (6194, 6229), (6295, 6333), (6409, 6446), (6523, 6560), (6637, 6687), (6703, 6718), (6749, 6784), (6833, 6848), (6879, 6923), (6983, 7003), (7020, 7038), (7054, 7085), (7116, 7212), (7232, 7244), (7261, 7292), (7341, 7374), (7424, 7465), (7515, 7554), (7610, 7679), (7736, 7815), (7877, 7997), (8014, 8077), (8108, 8172), (8221, 8323), (8373, 8443), (8493, 8569), (8636, 8681), (8752, 8876), (8907, 8937), (8968, 8977), (9044, 9086), (9157, 9170), (9243, 9243), (9304, 9304), (9365, 9512), (9538, 9556), (9587, 9602), (9633, 9681), (9698, 9759), (9790, 9839), (9876, 9906), (9973, 10012), (10083, 10127), (10183, 10236), (10296, 10346), (10397, 10412), (10443, 10466), (10517, 10517), (10571, 10606), (10641, 10642), (10755, 10772), (10866, 10867), (10962, 11004), (11035, 11092), (11123, 11285), (11302, 11414), (11469, 11538), (11598, 11657), (11713, 11911), (11927, 11942), (11973, 12035), (12085, 12126), (12166, 12181), (12212, 12254), (12314, 12353), (12407, 12520), (12549, 12587), (12604, 12616), (12646, 12660), (12677, 12762), (12778, 12863), (12894, 12921), (12952, 13042), (13073, 13103), (13134, 13221), (13252, 13281), (13312, 13418), (13449, 13479), (13510, 14025), (14041, 14056), (14087, 14145), (14180, 14248), (14279, 14358), (14407, 14488), (14538, 14564), (14580, 14607), (14638, 14667), (14733, 14733), (14795, 14795), (14849, 14895), (14961, 14961), (15023, 15023), (15077, 15099), (15163, 15163), (15225, 15225), (15277, 15293), (15328, 15340), (15375, 15383), (15447, 15447), (15509, 15509), (15561, 15602), (15618, 15626), (15690, 15690), (15752, 15752), (15804, 15844), (15860, 15924), (15959, 15984), (16000, 16024), (16055, 16082), (16113, 16168), (16185, 16216), (16232, 16284), (16301, 16348), (16418, 16464), (16538, 16584), (16644, 16688), (16752, 17019), (17054, 17097), (17117, 17191), (17207, 17246), (17284, 17383), (17400, 17428), (17483, 17525), (17634, 17678), (17786, 18043), (18077, 18158), (18209, 18306), (18365, 18540), (18574, 18685), (18715, 18842), (18901, 18934), (18999, 19041), (19112, 19367), (19425, 19554), (19616, 19742), (19809, 19934), (20005, 20042), (20076, 20122), (20160, 20202), (20281, 20324), (20392, 20439), (20508, 20556), (20614, 20653), (20726, 20766), (20828, 20853), (20887, 20928), (20962, 20969), (21035, 21068), (21138, 21166), (21205, 21217), (21252, 21253), (21368, 21369), (21467, 21489), (21611, 21641), (21722, 21751), (21849, 21920), (21959, 21983), (22014, 22076), (22128, 22166), (22201, 22216), (22247, 22294), (22333, 22413), (22451, 22639), (22656, 22816), (22883, 22935), (23006, 23098), (23154, 23204), (23264, 23386), (23421, 23446), (23462, 23486), (23517, 23544), (23575, 23682), (23713, 23781), (23812, 23893), (23928, 23929), (24023, 24024), (24138, 24215), (24246, 24258), (24284, 24299), (24330, 24386), (24403, 24510), (24541, 24632), (24669, 24757), (24815, 24890), (24952, 25041), (25110, 25189), (25262, 25324), (25383, 25425), (25488, 25709), (25748, 25779), (25810, 25874), (25924, 26212), (26280, 26416), (26488, 26591), (26628, 26758), (26816, 26902), (26953, 27057), (27129, 27171), (27238, 27289), (27360, 27400), (27448, 27497), (27566, 27722), (27756, 27757)),
+    'slots': (0, 1, 1, 2, 3, 4, 3, 0, 5, 6, 7, 1, 8, 9, 10, 11, 6, 9, 5, 5, 0, 9, 12, 13, 14, 15, 16, 17, 5, 9, 18, 9, 9, 19, 7, 20, 21, 7, 20, 21, 5, 22, 23, 24, 25, 9, 26, 27, 28, 29, 30, 31, 32, 33, 34, 34, 34, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 5, 9, 44, 30, 45, 6, 5, 9, 0, 6, 46, 47, 47, 48, 49, 50, 6, 51, 46, 47, 47, 52, 53, 51, 51, 52, 53, 54, 55, 56, 57, 58, 9, 6, 9, 59, 52, 53, 60, 61, 62, 9, 63, 64, 7, 65, 20, 21, 9, 51, 6, 66, 67, 68, 5, 9, 69, 70, 9, 71, 72, 73, 6, 74, 6, 5, 51, 51, 51, 51, 51, 51, 51, 51, 5, 9, 75, 51, 46, 47, 5, 9, 76, 77, 64, 76, 77, 64, 78, 79, 80, 81, 81, 82, 83, 84, 5, 85, 86, 87, 5, 75, 5, 9, 9, 6, 5, 6, 88, 89, 90, 91, 81, 0, 5, 92, 6, 93, 94, 95, 96, 62, 97, 98, 99, 100, 101, 102, 23, 24, 52, 53, 98, 103, 104, 105, 106, 23, 107, 24, 98, 98, 108, 109, 110, 111, 112, 113, 114, 115, 116, 110, 51, 117, 111, 30, 110, 103, 6, 52, 53, 60, 61, 111, 5, 9, 9, 9, 9, 118, 20, 119, 58, 57, 9, 6, 9, 59, 120, 121, 122, 123, 124, 125, 126, 9, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 98),
+    'placeholders': (('{{background|color}}', 'background', (('color', {}),)), ('{{foreground|color}}', 'foreground', (('color', {}),)), ('{{primary|color(state="selection.background")}}', 'primary', (('color', {'state': 'selection.background'}),)), ('{{foreground|color(state="disabled")}}', 'foreground', (('color', {'state': 'disabled'}),)), ('{{foreground|color(state="disabledSelectionBackground")}}', 'foreground', (('color', {'state': 'disabledSelectionBackground'}),)), ('{{border|color}}', 'border', (('color', {}),)), ('{{primary|color}}', 'primary', (('color', {}),)), ('{{background|color(state="popup")}}', 'background', (('color', {'state': 'popup'}),)), ('{{statusBar.background|color}}', 'statusBar.background', (('color', {}),)), ('{{corner-shape|corner(size=4)}}', 'corner-shape', (('corner', {'size': 4}),)), ('{{statusBarItem.hoverBackground|color}}', 'statusBarItem.hoverBackground', (('color', {}),)), ('{{statusBarItem.activeBackground|color}}', 'statusBarItem.activeBackground', (('color', {}),)), ('{{menubar.selectionBackground|color}}', 'menubar.selectionBackground', (('color', {}),)), ('{{toolbar.background|color}}', 'toolbar.background', (('color', {}),)), ('{{foreground|color(state="icon")|url(id="drag_indicator")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'drag_indicator'}))), ('{{foreground|color(state="icon")|url(id="drag_indicator",rotate=90)}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'drag_indicator', 'rotate': 90}))), ('{{foreground|color(state="disabled")|url(id="drag_indicator")}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'drag_indicator'}))), ('{{foreground|color(state="disabled")|url(id="drag_indicator",rotate=90)}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'drag_indicator', 'rotate': 90}))), ('{{toolbar.hoverBackground|color}}', 'toolbar.hoverBackground', (('color', {}),)), ('{{toolbar.activeBackground|color}}', 'toolbar.activeBackground', (('color', {}),)), ('{{corner-shape|corner(size=4)|env(value="border-radius:${}px;",version="<6.0.0",os="Darwin")}}', 'corner-shape', (('corner', {'size': 4}), ('env', {'value': 'border-radius:${}px;', 'version': '<6.0.0', 'os': 'Darwin'}))), ('{{corner-shape|corner(size=4)|env(value="border-radius:${}px;",version=">=6.4.1",os="Darwin")}}', 'corner-shape', (('corner', {'size': 4}), ('env', {'value': 'border-radius:${}px;', 'version': '>=6.4.1', 'os': 'Darwin'}))), ('{{popupItem.selectionBackground|color}}', 'popupItem.selectionBackground', (('color', {}),)), ('{{foreground|color(state="icon")|url(id="chevron_right")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'chevron_right'}))), ('{{foreground|color(state="disabled")|url(id="chevron_right")}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'chevron_right'}))), ('{{scrollbar.background|color}}', 'scrollbar.background', (('color', {}),)), ('{{|env(value="background:transparent",os="Darwin")}}', '', (('env', {'value': 'background:transparent', 'os': 'Darwin'}),)), ('{{|env(value="height:7px;",os="Darwin")}}', '', (('env', {'value': 'height:7px;', 'os': 'Darwin'}),)), ('{{|env(value="width:7px;",os="Darwin")}}', '', (('env', {'value': 'width:7px;', 'os': 'Darwin'}),)), ('{{scrollbarSlider.background|color}}', 'scrollbarSlider.background', (('color', {}),)), ('{{corner-shape|corner(size=3)}}', 'corner-shape', (('corner', {'size': 3}),)), ('{{scrollbarSlider.hoverBackground|color}}', 'scrollbarSlider.hoverBackground', (('color', {}),)), ('{{scrollbarSlider.activeBackground|color}}', 'scrollbarSlider.activeBackground', (('color', {}),)), ('{{scrollbarSlider.disabledBackground|color}}', 'scrollbarSlider.disabledBackground', (('color', {}),)), ('{{|env(value="margin:0;",os="Darwin")}}', '', (('env', {'value': 'margin:0;', 'os': 'Darwin'}),)), ('{{|env(value="width:0;height:0",os="Darwin")}}', '', (('env', {'value': 'width:0;height:0', 'os': 'Darwin'}),)), ('{{scrollbarSlider.background|color|url(id="arrow_drop_up")}}', 'scrollbarSlider.background', (('color', {}), ('url', {'id': 'arrow_drop_up'}))), ('{{scrollbarSlider.background|color|url(id="arrow_drop_up",rotate=90)}}', 'scrollbarSlider.background', (('color', {}), ('url', {'id': 'arrow_drop_up', 'rotate': 90}))), ('{{scrollbarSlider.background|color|url(id="arrow_drop_up",rotate=180)}}', 'scrollbarSlider.background', (('color', {}), ('url', {'id': 'arrow_drop_up', 'rotate': 180}))), ('{{scrollbarSlider.background|color|url(id="arrow_drop_up",rotate=270)}}', 'scrollbarSlider.background', (('color', {}), ('url', {'id': 'arrow_drop_up', 'rotate': 270}))), ('{{scrollbarSlider.activeBackground|color|url(id="arrow_drop_up")}}', 'scrollbarSlider.activeBackground', (('color', {}), ('url', {'id': 'arrow_drop_up'}))), ('{{scrollbarSlider.activeBackground|color|url(id="arrow_drop_up",rotate=90)}}', 'scrollbarSlider.activeBackground', (('color', {}), ('url', {'id': 'arrow_drop_up', 'rotate': 90}))), ('{{scrollbarSlider.activeBackground|color|url(id="arrow_drop_up",rotate=180)}}', 'scrollbarSlider.activeBackground', (('color', {}), ('url', {'id': 'arrow_drop_up', 'rotate': 180}))), ('{{scrollbarSlider.activeBackground|color|url(id="arrow_drop_up",rotate=270)}}', 'scrollbarSlider.activeBackground', (('color', {}), ('url', {'id': 'arrow_drop_up', 'rotate': 270}))), ('{{primary|color(state="progressBar.background")}}', 'primary', (('color', {'state': 'progressBar.background'}),)), ('{{foreground|color(state="progressBar.disabledBackground")}}', 'foreground', (('color', {'state': 'progressBar.disabledBackground'}),)), ('{{primary|color(state="button.hoverBackground")}}', 'primary', (('color', {'state': 'button.hoverBackground'}),)), ('{{primary|color(state="button.activeBackground")}}', 'primary', (('color', {'state': 'button.activeBackground'}),)), ('{{primary|color(state="defaultButton.hoverBackground")}}', 'primary', (('color', {'state': 'defaultButton.hoverBackground'}),)), ('{{primary|color(state="defaultButton.activeBackground")}}', 'primary', (('color', {'state': 'defaultButton.activeBackground'}),)), ('{{foreground|color(state="defaultButton.disabledBackground")}}', 'foreground', (('color', {'state': 'defaultButton.disabledBackground'}),)), ('{{corner-shape|corner(size=2)}}', 'corner-shape', (('corner', {'size': 2}),)), ('{{foreground|color(state="icon")|url(id="expand_less",rotate=180)}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'expand_less', 'rotate': 180}))), ('{{foreground|color(state="disabled")|url(id="expand_less",rotate=180)}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'expand_less', 'rotate': 180}))), ('{{|env(value="popupMode=MenuButtonPopup",version="<6.0.0",qt="PySide2")}}', '', (('env', {'value': 'popupMode=MenuButtonPopup', 'version': '<6.0.0', 'qt': 'PySide2'}),)), ('{{|env(value="popupMode=\\"1\\"",version="<6.0.0",qt="PyQt5")}}', '', (('env', {'value': 'popupMode="1"', 'version': '<6.0.0', 'qt': 'PyQt5'}),)), ('{{|env(value="popupMode=MenuButtonPopup",version=">=6.0.0")}}', '', (('env', {'value': 'popupMode=MenuButtonPopup', 'version': '>=6.0.0'}),)), ('{{input.background|color}}', 'input.background', (('color', {}),)), ('{{border|color(state="input")}}', 'border', (('color', {'state': 'input'}),)), ('{{inputButton.hoverBackground|color}}', 'inputButton.hoverBackground', (('color', {}),)), ('{{foreground|color(state="icon")|url(id="expand_less")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'expand_less'}))), ('{{foreground|color(state="disabled")|url(id="expand_less")}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'expand_less'}))), ('{{primary|color(state="list.selectionBackground")}}', 'primary', (('color', {'state': 'list.selectionBackground'}),)), ('{{|env(value="frameShape=\\"0\\"",version="<6.0.0")}}', '', (('env', {'value': 'frameShape="0"', 'version': '<6.0.0'}),)), ('{{|env(value="frameShape=NoFrame",version=">=6.0.0")}}', '', (('env', {'value': 'frameShape=NoFrame', 'version': '>=6.0.0'}),)), ('{{primary|color(state="list.selectionBackground")|env(value="selection-background-color:${};",version="<6.0.0")}}', 'primary', (('color', {'state': 'list.selectionBackground'}), ('env', {'value': 'selection-background-color:${};', 'version': '<6.0.0'}))), ('{{foreground|color(state="slider.disabledBackground")}}', 'foreground', (('color', {'state': 'slider.disabledBackground'}),)), ('{{foreground|color(state="sliderTrack.inactiveBackground")}}', 'foreground', (('color', {'state': 'sliderTrack.inactiveBackground'}),)), ('{{primary|color(state="sliderHandle.activeBackground")}}', 'primary', (('color', {'state': 'sliderHandle.activeBackground'}),)), ('{{foreground|color(state="icon")|url(id="close")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'close'}))), ('{{tabCloseButton.hoverBackground|color}}', 'tabCloseButton.hoverBackground', (('color', {}),)), ('{{foreground|color(state="icon.unfocused")|url(id="close")}}', 'foreground', (('color', {'state': 'icon.unfocused'}), ('url', {'id': 'close'}))), ('{{foreground|color(state="disabled")|url(id="close")}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'close'}))), ('{{tab.hoverBackground|color}}', 'tab.hoverBackground', (('color', {}),)), ('{{tab.activeBackground|color}}', 'tab.activeBackground', (('color', {}),)), ('{{background|color(state="title")}}', 'background', (('color', {'state': 'title'}),)), ('{{|env(value="frameShape=NoFrame",version="<6.0.0",qt="PySide2")}}', '', (('env', {'value': 'frameShape=NoFrame', 'version': '<6.0.0', 'qt': 'PySide2'}),)), ('{{|env(value="frameShape=\\"0\\"",version="<6.0.0",qt="PyQt5")}}', '', (('env', {'value': 'frameShape="0"', 'version': '<6.0.0', 'qt': 'PyQt5'}),)), ('{{|env(value="frameShape=Panel",version="<6.0.0",qt="PySide2")}}', '', (('env', {'value': 'frameShape=Panel', 'version': '<6.0.0', 'qt': 'PySide2'}),)), ('{{|env(value="frameShape=\\"2\\"",version="<6.0.0",qt="PyQt5")}}', '', (('env', {'value': 'frameShape="2"', 'version': '<6.0.0', 'qt': 'PyQt5'}),)), ('{{|env(value="frameShape=Panel",version=">=6.0.0")}}', '', (('env', {'value': 'frameShape=Panel', 'version': '>=6.0.0'}),)), ('{{background|color(state="panel")}}', 'background', (('color', {'state': 'panel'}),)), ('{{|env(value="frameShape=HLine",version="<6.0.0",qt="PySide2")}}', '', (('env', {'value': 'frameShape=HLine', 'version': '<6.0.0', 'qt': 'PySide2'}),)), ('{{|env(value="frameShape=\\"4\\"",version="<6.0.0",qt="PyQt5")}}', '', (('env', {'value': 'frameShape="4"', 'version': '<6.0.0', 'qt': 'PyQt5'}),)), ('{{|env(value="frameShape=HLine",version=">=6.0.0")}}', '', (('env', {'value': 'frameShape=HLine', 'version': '>=6.0.0'}),)), ('{{|env(value="frameShape=VLine",version="<6.0.0",qt="PySide2")}}', '', (('env', {'value': 'frameShape=VLine', 'version': '<6.0.0', 'qt': 'PySide2'}),)), ('{{|env(value="frameShape=\\"5\\"",version="<6.0.0",qt="PyQt5")}}', '', (('env', {'value': 'frameShape="5"', 'version': '<6.0.0', 'qt': 'PyQt5'}),)), ('{{|env(value="frameShape=VLine",version=">=6.0.0")}}', '', (('env', {'value': 'frameShape=VLine', 'version': '>=6.0.0'}),)), ('{{foreground|color(state="icon")|url(id="horizontal_rule",rotate=90)}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'horizontal_rule', 'rotate': 90}))), ('{{foreground|color(state="disabled")|url(id="horizontal_rule",rotate=90)}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'horizontal_rule', 'rotate': 90}))), ('{{foreground|color(state="icon")|url(id="horizontal_rule")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'horizontal_rule'}))), ('{{foreground|color(state="disabled")|url(id="horizontal_rule")}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'horizontal_rule'}))), ('{{background|color(state="textarea")}}', 'background', (('color', {'state': 'textarea'}),)), ('{{primary|color(state="textarea.selectionBackground")}}', 'primary', (('color', {'state': 'textarea.selectionBackground'}),)), ('{{textarea.inactiveSelectionBackground|color|env(value="selection-background-color:${}",version=">=5.15.0")}}', 'textarea.inactiveSelectionBackground', (('color', {}), ('env', {'value': 'selection-background-color:${}', 'version': '>=5.15.0'}))), ('{{textarea.inactiveSelectionBackground|color|env(value="selection-background-color:${}",version="<5.15.0")}}', 'textarea.inactiveSelectionBackground', (('color', {}), ('env', {'value': 'selection-background-color:${}', 'version': '<5.15.0'}))), ('{{list.alternateBackground|color}}', 'list.alternateBackground', (('color', {}),)), ('{{primary|color(state="list.inactiveSelectionBackground")}}', 'primary', (('color', {'state': 'list.inactiveSelectionBackground'}),)), ('{{background|color(state="list")}}', 'background', (('color', {'state': 'list'}),)), ('{{list.hoverBackground|color}}', 'list.hoverBackground', (('color', {}),)), ('{{|env(value="background:transparent;",version=">=6.4.1")}}', '', (('env', {'value': 'background:transparent;', 'version': '>=6.4.1'}),)), ('{{tree.inactiveIndentGuidesStroke|color|url(id="vertical_line")}}', 'tree.inactiveIndentGuidesStroke', (('color', {}), ('url', {'id': 'vertical_line'}))), ('{{tree.indentGuidesStroke|color(state="icon")|url(id="vertical_line")}}', 'tree.indentGuidesStroke', (('color', {'state': 'icon'}), ('url', {'id': 'vertical_line'}))), ('{{treeSectionHeader.background|color}}', 'treeSectionHeader.background', (('color', {}),)), ('{{foreground|color(state="icon.unfocused")|url(id="chevron_right",rotate=180)}}', 'foreground', (('color', {'state': 'icon.unfocused'}), ('url', {'id': 'chevron_right', 'rotate': 180}))), ('{{foreground|color(state="icon.unfocused")|url(id="chevron_right")}}', 'foreground', (('color', {'state': 'icon.unfocused'}), ('url', {'id': 'chevron_right'}))), ('{{foreground|color(state="icon")|url(id="chevron_right",rotate=180)}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'chevron_right', 'rotate': 180}))), ('{{foreground|color(state="disabled")|url(id="chevron_right",rotate=180)}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'chevron_right', 'rotate': 180}))), ('{{foreground|color(state="icon")|url(id="drag_handle",rotate=90)}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'drag_handle', 'rotate': 90}))), ('{{foreground|color(state="disabled")|url(id="drag_handle",rotate=90)}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'drag_handle', 'rotate': 90}))), ('{{tableSectionHeader.background|color}}', 'tableSectionHeader.background', (('color', {}),)), ('{{background|color(state="table")}}', 'background', (('color', {'state': 'table'}),)), ('{{primary|color(state="table.selectionBackground")|env(value="selection-background-color:${};",version=">=6.4.1")}}', 'primary', (('color', {'state': 'table.selectionBackground'}), ('env', {'value': 'selection-background-color:${};', 'version': '>=6.4.1'}))), ('{{table.alternateBackground|color|env(value="alternate-background-color:${};",version=">=6.4.1")}}', 'table.alternateBackground', (('color', {}), ('env', {'value': 'alternate-background-color:${};', 'version': '>=6.4.1'}))), ('{{primary|color(state="table.inactiveSelectionBackground")|env(value="selection-background-color:${};",version="<6.4.1")}}', 'primary', (('color', {'state': 'table.inactiveSelectionBackground'}), ('env', {'value': 'selection-background-color:${};', 'version': '<6.4.1'}))), ('{{table.alternateBackground|color|env(value="background:${};",version="<6.4.1")}}', 'table.alternateBackground', (('color', {}), ('env', {'value': 'background:${};', 'version': '<6.4.1'}))), ('{{primary|color(state="table.selectionBackground")|env(value="background:${};",version="<6.4.1")}}', 'primary', (('color', {'state': 'table.selectionBackground'}), ('env', {'value': 'background:${};', 'version': '<6.4.1'}))), ('{{primary|color(state="table.selectionBackground")}}', 'primary', (('color', {'state': 'table.selectionBackground'}),)), ('{{table.alternateBackground|color}}', 'table.alternateBackground', (('color', {}),)), ('{{primary|color(state="table.selectionBackground")|env(value="selection-background-color:${};",version="<6.0.0")}}', 'primary', (('color', {'state': 'table.selectionBackground'}), ('env', {'value': 'selection-background-color:${};', 'version': '<6.0.0'}))), ('{{foreground|color(state="icon")|url(id="arrow_drop_up")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'arrow_drop_up'}))), ('{{foreground|color(state="disabled")|url(id="arrow_drop_up")}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'arrow_drop_up'}))), ('{{foreground|color(state="icon")|url(id="arrow_drop_up",rotate=180)}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'arrow_drop_up', 'rotate': 180}))), ('{{foreground|color(state="disabled")|url(id="arrow_drop_up",rotate=180)}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'arrow_drop_up', 'rotate': 180}))), ('{{foreground|color(state="icon")|url(id="calendar_today")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'calendar_today'}))), ('{{foreground|color(state="disabled")|url(id="calendar_today")}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'calendar_today'}))), ('{{popupItem.checkbox.background|color}}', 'popupItem.checkbox.background', (('color', {}),)), ('{{foreground|color(state="icon")|url(id="check")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'check'}))), ('{{foreground|color(state="icon")|url(id="check_box_outline_blank")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'check_box_outline_blank'}))), ('{{foreground|color(state="disabled")|url(id="check_box_outline_blank")}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'check_box_outline_blank'}))), ('{{primary|color|url(id="check_box")}}', 'primary', (('color', {}), ('url', {'id': 'check_box'}))), ('{{foreground|color(state="disabled")|url(id="check_box")}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'check_box'}))), ('{{primary|color|url(id="indeterminate_check_box")}}', 'primary', (('color', {}), ('url', {'id': 'indeterminate_check_box'}))), ('{{foreground|color(state="disabled")|url(id="indeterminate_check_box")}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'indeterminate_check_box'}))), ('{{foreground|color(state="icon")|url(id="radio_button_unchecked")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'radio_button_unchecked'}))), ('{{foreground|color(state="disabled")|url(id="radio_button_unchecked")}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'radio_button_unchecked'}))), ('{{primary|color|url(id="radio_button_checked")}}', 'primary', (('color', {}), ('url', {'id': 'radio_button_checked'}))), ('{{foreground|color(state="disabled")|url(id="radio_button_checked")}}', 'foreground', (('color', {'state': 'disabled'}), ('url', {'id': 'radio_button_checked'})))),
+    'required': ('background', 'foreground', 'primary', 'border', 'statusBar.background', 'corner-shape', 'statusBarItem.hoverBackground', 'statusBarItem.activeBackground', 'menubar.selectionBackground', 'toolbar.background', 'toolbar.hoverBackground', 'toolbar.activeBackground', 'popupItem.selectionBackground', 'scrollbar.background', 'scrollbarSlider.background', 'scrollbarSlider.hoverBackground', 'scrollbarSlider.activeBackground', 'scrollbarSlider.disabledBackground', 'input.background', 'inputButton.hoverBackground', 'tabCloseButton.hoverBackground', 'tab.hoverBackground', 'tab.activeBackground', 'textarea.inactiveSelectionBackground', 'list.alternateBackground', 'list.hoverBackground', 'tree.inactiveIndentGuidesStroke', 'tree.indentGuidesStroke', 'treeSectionHeader.background', 'tableSectionHeader.background', 'table.alternateBackground', 'popupItem.checkbox.background'),
+}
+
+TEMPLATE_STANDARD_ICONS_STYLESHEET_PLAN = {
+    'hash': '7bcb187c2c14fbcb7afe484ed58880ab765b75a2',
+    'literals': ((0, 31), (99, 116), (183, 218), (267, 314), (364, 386), (444, 471), (539, 569), (618, 644), (698, 729), (791, 825), (882, 896), (963, 975), (1088, 1126), (1181, 1205), (1258, 1292), (1349, 1350)),
+    'slots': (0, 1, 2, 3, 4, 0, 5, 6, 7, 8, 1, 9, 10, 11, 12),
+    'placeholders': (('{{foreground|color(state="icon")|url(id="arrow_upward",rotate=270)}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'arrow_upward', 'rotate': 270}))), ('{{foreground|color(state="icon")|url(id="arrow_upward",rotate=90)}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'arrow_upward', 'rotate': 90}))), ('{{foreground|color(state="icon")|url(id="east")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'east'}))), ('{{foreground|color(state="icon")|url(id="close")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'close'}))), ('{{foreground|color(state="icon")|url(id="flip_to_front")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'flip_to_front'}))), ('{{foreground|color(state="icon")|url(id="list")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'list'}))), ('{{foreground|color(state="icon")|url(id="grid_view")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'grid_view'}))), ('{{foreground|color(state="icon")|url(id="create_new_folder")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'create_new_folder'}))), ('{{foreground|color(state="icon")|url(id="arrow_upward")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'arrow_upward'}))), ('{{foreground|color(state="icon")|url(id="close")|env(value="lineedit-clear-button-icon:${};",version=">=6.0.0")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'close'}), ('env', {'value': 'lineedit-clear-button-icon:${};', 'version': '>=6.0.0'}))), ('{{foreground|color(state="icon")|url(id="fullscreen")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'fullscreen'}))), ('{{foreground|color(state="icon")|url(id="minimize")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'minimize'}))), ('{{foreground|color(state="icon")|url(id="double_arrow")}}', 'foreground', (('color', {'state': 'icon'}), ('url', {'id': 'double_arrow'})))),
+    'required': ('foreground',),
+}
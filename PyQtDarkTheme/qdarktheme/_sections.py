@@ -0,0 +1,167 @@
+"""Module for splitting the template stylesheets by the widget classes their selectors match.
+
+Each rule of a template is split into its comma separated selectors, and each selector is keyed by
+the widget classes it names, such as ``QStatusBar`` and ``QWidget`` for ``QStatusBar QWidget``.
+A selector can only match when all of them are in use, so the section of a set of classes is
+the rules with those selectors only, in template order.
+"""
+
+import re
+from functools import lru_cache
+
+from qdarktheme._template.engine import Template
+
+_RULE_RE = re.compile(r"([^{}]*)\{[^{}]*\}")
+_SELECTOR_RE = re.compile(r"[^,]+")
+_ATTRIBUTE_RE = re.compile(r"\[[^\]]*\]")
+_PSEUDO_RE = re.compile(r"::?!?[\w-]+")
+_CLASS_RE = re.compile(r"(?:^|(?<=[\s>+~]))\.?([A-Za-z_]\w*)")
+
+# Tooltips and the standard context menus of text widgets are created on demand for any widget,
+# so they are never found in the widget tree.
+_ALWAYS_USED = frozenset(["QWidget", "QToolTip", "QMenu"])
+# Widgets whose popups Qt creates on first use, with the classes of those popups.
+_LAZY_POPUPS = {
+    "QComboBox": ("QListView", "QAbstractItemView", "QAbstractScrollArea", "QFrame"),
+    "QDateTimeEdit": (
+        "QCalendarWidget",
+        "QTableView",
+        "QAbstractItemView",
+        "QAbstractScrollArea",
+        "QFrame",
+        "QToolButton",
+        "QAbstractButton",
+        "QSpinBox",
+        "QAbstractSpinBox",
+    ),
+}
+
+
+def _mask_placeholders(text) -> str:
+    """Return ``text`` with the placeholders replaced by spaces, keeping every offset."""
+    return Template._PLACEHOLDER_RE.sub(lambda match: " " * len(match.group()), text)
+
+
+def _selector_classes(selector) -> frozenset:
+    selector = _PSEUDO_RE.sub("", _ATTRIBUTE_RE.sub("", selector))
+    return frozenset(_CLASS_RE.findall(selector))
+
+
+class _Rule:
+    """A rule of a template with the classes of each of its selectors."""
+
+    __slots__ = ("text", "selectors", "block")
+
+    def __init__(self, text, selectors, block) -> None:
+        self.text = text
+        self.selectors = selectors
+        self.block = block
+
+    def select(self, widget_classes) -> str:
+        """Return the rule text with the selectors that can match ``widget_classes`` only."""
+        selectors = [selector for selector, classes in self.selectors if classes <= widget_classes]
+        if len(selectors) == len(self.selectors):
+            return self.text
+        if not selectors:
+            return ""
+        return ",".join(selectors) + self.block
+
+
+@lru_cache(maxsize=None)
+def split_rules(text) -> tuple:
+    """Return the rules of the template ``text`` in order.
+
+    Placeholders are masked while splitting, since the ``env`` filter arguments contain braces.
+    """
+    rules = []
+    masked = _mask_placeholders(text)
+    for match in _RULE_RE.finditer(masked):
+        start, end = match.span(1)
+        selectors = tuple(
+            (text[part.start() : part.end()].strip(), _selector_classes(part.group()))
+            for part in _SELECTOR_RE.finditer(masked, start, end)
+        )
+        block_start = start + len(text[start:end].rstrip())
+        rules.append(_Rule(text[match.start() : match.end()], selectors, text[block_start : match.end()]))
+    return tuple(rules)
+
+
+@lru_cache(maxsize=None)
+def template_classes(text) -> frozenset:
+    """Return every widget class the selectors of the template ``text`` name."""
+    return frozenset().union(*(classes for rule in split_rules(text) for _, classes in rule.selectors))
+
+
+@lru_cache(maxsize=None)
+def empty_rule_selectors(text) -> frozenset:
+    """Return the selectors of the rules of the template ``text`` written without declarations."""
+    return frozenset(
+        selector
+        for rule in split_rules(text)
+        if not rule.block.strip().strip("{}").strip()
+        for selector, _ in rule.selectors
+        if "{{" not in selector
+    )
+
+
+@lru_cache(maxsize=64)
+def section_text(text, widget_classes) -> str:
+    """Return the part of the template ``text`` that can match the frozenset ``widget_classes``."""
+    return "".join(rule.select(widget_classes) for rule in split_rules(text))
+
+
+def _class_hierarchy(meta_object, classes) -> None:
+    while meta_object is not None and meta_object.className() not in classes:
+        classes.add(meta_object.className())
+        meta_object = meta_object.superClass()
+
+
+def _add_lazy_popups(classes) -> None:
+    for name, popup_classes in _LAZY_POPUPS.items():
+        if name in classes:
+            classes.update(popup_classes)
+
+
+def expand_widget_classes(names) -> set:
+    """Return the class names with the Qt classes they inherit, such as ``QAbstractButton``.
+
+    Names that are not Qt widget classes, such as the classes of other packages, are kept as is.
+    The classes of the popups Qt creates on first use, such as the view of ``QComboBox``, are
+    added too.
+    """
+    from qdarktheme.qtpy.qt_compat import QT_API
+
+    classes = set(_ALWAYS_USED)
+    QtWidgets = None  # noqa: N806
+    if QT_API is not None:
+        from qdarktheme.qtpy import QtWidgets  # noqa: N812
+    for name in names:
+        widget_class = getattr(QtWidgets, name, None)
+        if widget_class is not None and hasattr(widget_class, "staticMetaObject"):
+            _class_hierarchy(widget_class.staticMetaObject, classes)
+        else:
+            classes.add(name)
+    _add_lazy_popups(classes)
+    return classes
+
+
+def used_widget_classes(root=None) -> frozenset:
+    """Return the class names of the live widgets and of their base classes.
+
+    The classes of the popups Qt creates on first use, such as context menus and the view of
+    ``QComboBox``, are included even if they do not exist yet.
+
+    Args:
+        root: The widget whose subtree is walked. If None, all widgets of the application.
+
+    Returns:
+        Frozenset of class names. Python subclasses of widgets are named after the Python class.
+    """
+    from qdarktheme.qtpy.QtWidgets import QApplication, QWidget
+
+    widgets = QApplication.allWidgets() if root is None else [root] + root.findChildren(QWidget)
+    classes = set(_ALWAYS_USED)
+    for widget in widgets:
+        _class_hierarchy(widget.metaObject(), classes)
+    _add_lazy_popups(classes)
+    return frozenset(classes)
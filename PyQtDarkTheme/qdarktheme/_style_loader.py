@@ -1,52 +1,242 @@
 """Module for loading style data for Qt."""
 
 import json
-
-from qdarktheme import __version__, _resources
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain
+
+from qdarktheme import __version__, _bundle, _resources, _stylesheet_cache
+from qdarktheme._color_table import ColorTable
+from qdarktheme._contrast import audit_color_table
+from qdarktheme._prewarm import Prewarmer
+from qdarktheme._qss import OptimizedStylesheet, RuleDiff
+from qdarktheme._sections import (
+    empty_rule_selectors,
+    expand_widget_classes,
+    section_text,
+    template_classes,
+    used_widget_classes,
+)
 from qdarktheme._template import filter
-from qdarktheme._template.engine import Template
-from qdarktheme._util import get_cash_root_path
+from qdarktheme._template.codegen import CodeTemplate
+from qdarktheme._template.engine import Template, get_template
+from qdarktheme._theme_context import get_theme_context
+from qdarktheme._util import get_cash_root_path, get_logger
+
+_logger = get_logger(__name__)
+
+_STYLESHEET_FILTERS = {"color": filter.color, "corner": filter.corner, "env": filter.env, "url": filter.url}
+_PALETTE_FILTERS = {"color": filter.color, "palette": filter.palette_format}
+_prewarmer = None
+_executor = None
+_executor_lock = threading.Lock()
+# Stylesheets rendered but not written to the disk cache yet, keyed by the arguments of
+# _render_stylesheet without optimize. They are written when load_stylesheet returns them.
+_unsaved = OrderedDict()
+_MAX_UNSAVED = 32
+_unsaved_lock = threading.Lock()
+
+
+def _canonical_custom_colors(custom_colors) -> str:
+    """Return the canonical text of custom_colors including its ``[dark]``/``[light]`` sections."""
+    return json.dumps(custom_colors, sort_keys=True, separators=(",", ":"))
+
+
+def _load_color_table(theme, custom_colors_key):
+    return get_theme_context(theme).get_color_table(custom_colors_key)
 
 
+def load_color_table(theme = "dark", custom_colors = None) -> ColorTable:
+    """Return the colors of the theme resolved to their final values.
 
-def _color_values(theme):
+    The table is computed once per theme and custom_colors, and shared by stylesheets and palettes.
+
+    Args:
+        theme: The theme name. There are `dark` and `light`.
+        custom_colors: The custom color map. Overrides the default color for color id you set.
+
+    Raises:
+        ValueError: If the arguments of this method is wrong.
+        KeyError: If the color id of custom_colors is wrong.
+
+    Returns:
+        ColorTable mapping every ``id`` and ``id:state`` to its Color.
+    """
+    return _load_color_table(theme, _canonical_custom_colors(custom_colors))
+
+
+def _use_icons_stylesheet() -> bool:
+    """Return True if the standard icons stylesheet is needed, which is without ``setup_theme``."""
+    from qdarktheme.qtpy.qt_compat import QT_API
+
+    if QT_API is None:
+        # Importing QtCore would raise, and retrying the failed import on every call is slow.
+        return False
     try:
-        return json.loads(_resources.colors.THEME_COLOR_VALUES[theme])
-    except KeyError:
-        raise ValueError('invalid argument, not a dark, light or auto: "{}"'.format(theme)) from None
-
-
-def _mix_theme_colors(custom_colors, theme):
-    colors = {id: color for id, color in custom_colors.items() if isinstance(color, str)}
-    custom_colors_with_theme = custom_colors.get("[{}]".format(theme))
-    if isinstance(custom_colors_with_theme, dict):
-        colors.update(custom_colors_with_theme)
-    elif isinstance(custom_colors_with_theme, str):
-        raise ValueError(
-            "invalid value for argument custom_colors, not a dict type: "
-            '"{}" of "[{}]" key.'.format(custom_colors_with_theme, theme)
+        from qdarktheme.qtpy.QtCore import QCoreApplication
+
+        app = QCoreApplication.instance()
+        return app is not None and not app.property("_qdarktheme_use_setup_style")
+    except Exception:  # noqa: PIE786
+        return False
+
+
+def _canonical_widget_classes(widget_classes, with_icons):
+    """Return the frozenset of the used classes the templates name, or None for all of them."""
+    if widget_classes is None:
+        return None
+    if isinstance(widget_classes, str):
+        if widget_classes != "auto":
+            raise ValueError(
+                'invalid argument, not a list of class names or auto: "{}"'.format(widget_classes)
+            )
+        classes = used_widget_classes()
+    else:
+        classes = expand_widget_classes(widget_classes)
+    named = template_classes(_resources.stylesheets.TEMPLATE_STYLESHEET)
+    if with_icons:
+        named |= template_classes(_resources.stylesheets.TEMPLATE_STANDARD_ICONS_STYLESHEET)
+    classes = named.intersection(classes)
+    return None if classes == named else classes
+
+
+def _stylesheet_sources(theme, corner_shape, custom_colors_key, with_icons, widget_classes=None):
+    """Return the template sections as ``(text, plan)`` and the replacements of the stylesheet.
+
+    If ``widget_classes`` is a frozenset, the sections only have the rules that can match them.
+    """
+    color_table = _load_color_table(theme, custom_colors_key)
+    if corner_shape not in ("rounded", "sharp"):
+        raise ValueError('invalid argument, not a rounded or sharp: "{}"'.format(corner_shape))
+
+    try:
+        get_cash_root_path(__version__).mkdir(parents=True, exist_ok=True)
+    except:
+        pass
+
+    sections = [(_resources.stylesheets.TEMPLATE_STYLESHEET, _resources.plans.TEMPLATE_STYLESHEET_PLAN)]
+    if with_icons:
+        sections.append(
+            (
+                _resources.stylesheets.TEMPLATE_STANDARD_ICONS_STYLESHEET,
+                _resources.plans.TEMPLATE_STANDARD_ICONS_STYLESHEET_PLAN,
+            )
         )
-    return colors
 
+    if widget_classes is not None:
+        sections = [(section_text(text, widget_classes), None) for text, _ in sections]
 
-def _marge_colors(
-    color_values, custom_colors, theme
+    replacements = dict(color_table.replacements, **{"corner-shape": corner_shape})
+    return sections, replacements
+
+
+def _template_empty_selectors() -> frozenset:
+    """Return the selectors of the template rules that are empty on purpose."""
+    return empty_rule_selectors(_resources.stylesheets.TEMPLATE_STYLESHEET) | empty_rule_selectors(
+        _resources.stylesheets.TEMPLATE_STANDARD_ICONS_STYLESHEET
+    )
+
+
+def _stylesheet_template(theme, text, plan):
+    """Return the template of a section.
+
+    The built-in templates have a plan and are compiled to code cached on disk. The sections
+    reduced to some widget classes have none, and are cheap to parse again, so they are not.
+    """
+    template_class = Template if plan is None else CodeTemplate
+    return get_theme_context(theme).get_template(text, _STYLESHEET_FILTERS, template_class, plan)
+
+
+@lru_cache(maxsize=32)
+def _render_stylesheet(
+    theme, corner_shape, custom_colors_key, with_icons, widget_classes=None, optimize=False
 ):
-    for color_id, color in _mix_theme_colors(custom_colors, theme).items():
-        try:
-            parent_key, *child_keys = color_id.split(">")
-            color_value = color_values[parent_key]
-            if len(child_keys) > 1 or (isinstance(color_value, str) and len(child_keys) != 0):
-                raise KeyError
-
-            if isinstance(color_value, str):
-                color_values[parent_key] = color
-            else:
-                child_key = "base" if len(child_keys) == 0 else child_keys[0]
-                color_value[child_key]  # Check if child_key exists.
-                color_value[child_key] = color
-        except KeyError:
-            raise KeyError('invalid color id for argument custom_colors: "{}".'.format(color_id)) from None
+    if optimize:
+        optimized = OptimizedStylesheet(
+            _render_stylesheet(theme, corner_shape, custom_colors_key, with_icons, widget_classes),
+            _template_empty_selectors(),
+        )
+        _logger.debug("Optimized stylesheet: {}".format(optimized.metrics()))
+        return optimized.stylesheet
+
+    bundle = _bundle.get_bundle() if widget_classes is None else None
+    if bundle is not None:
+        stylesheet = bundle.get(_bundle.variant_key(theme, corner_shape, custom_colors_key, with_icons))
+        if stylesheet is not None:
+            return stylesheet
+
+    sections, replacements = _stylesheet_sources(
+        theme, corner_shape, custom_colors_key, with_icons, widget_classes
+    )
+    key = _stylesheet_cache.stylesheet_key(
+        [text for text, _ in sections], _load_color_table(theme, custom_colors_key), corner_shape
+    )
+    stylesheet = _stylesheet_cache.load_stylesheet(key)
+    if stylesheet is None:
+        stylesheet = "".join(
+            _stylesheet_template(theme, text, plan).render_incremental(replacements)
+            for text, plan in sections
+        )
+        variant = (theme, corner_shape, custom_colors_key, with_icons, widget_classes)
+        with _unsaved_lock:
+            _unsaved[variant] = (key, stylesheet)
+            while len(_unsaved) > _MAX_UNSAVED:
+                _unsaved.popitem(last=False)
+    return stylesheet
+
+
+def _load_stylesheet(theme, corner_shape, custom_colors_key, with_icons, widget_classes, optimize, persist) -> str:
+    """Return the stylesheet, writing it to the disk cache on a worker thread if ``persist``."""
+    stylesheet = _render_stylesheet(
+        theme, corner_shape, custom_colors_key, with_icons, widget_classes, optimize
+    )
+    if persist and _unsaved:
+        variant = (theme, corner_shape, custom_colors_key, with_icons, widget_classes)
+        with _unsaved_lock:
+            unsaved = _unsaved.pop(variant, None)
+        if unsaved is not None:
+            _get_executor().submit(_stylesheet_cache.dump_stylesheet, *unsaved)
+    return stylesheet
+
+
+def _prewarm_render(theme, corner_shape, custom_colors, with_icons) -> None:
+    _render_stylesheet(theme, corner_shape, _canonical_custom_colors(custom_colors), with_icons)
+
+
+def enable_prewarm(accents = None) -> None:
+    """Pre-render the likely next stylesheets on a worker thread after each :func:`load_stylesheet`.
+
+    The opposite theme, the other corner shape and the neighbouring accents of the loaded
+    stylesheet are rendered into the in-process cache one by one with a low priority, so that
+    switching to them is a cache hit. The built-in themes and accents are served pre-rendered
+    anyway, so this only pays off for custom colors. Call it once at application startup.
+
+    Args:
+        accents: The accent colors offered to the user in order, used to find the neighbouring
+            accents of ``custom_colors={"primary": accent}``. Either a sequence of hex strings or
+            a map of theme name to it, such as ``common.ACCENT_COLORS``.
+    """
+    global _prewarmer
+    disable_prewarm()
+    _prewarmer = Prewarmer(_prewarm_render, accents)
+
+
+def disable_prewarm() -> None:
+    """Stop pre-rendering and cancel the stylesheets not pre-rendered yet."""
+    global _prewarmer
+    if _prewarmer is not None:
+        _prewarmer.cancel()
+    _prewarmer = None
+
+
+def clear_cache() -> None:
+    """Clear the stylesheets, color tables and templates memoized by :func:`load_stylesheet`."""
+    _render_stylesheet.cache_clear()
+    with _unsaved_lock:
+        _unsaved.clear()
+    get_theme_context.cache_clear()
 
 
 def load_stylesheet(
@@ -54,6 +244,9 @@ def load_stylesheet(
     corner_shape = "rounded",
     custom_colors = None,
     default_theme = "dark",
+    widget_classes = None,
+    optimize = False,
+    persist = True,
 ) -> str:
     """Load the style sheet which looks like flat design. There are `dark` and `light` theme.
 
@@ -69,13 +262,28 @@ def load_stylesheet(
             Also you can customize a specific theme only. See example 6.
         default_theme: The default theme name.
             The theme set by this argument will be used when system theme detection fails.
+        widget_classes: The class names of the widgets to style, such as ``["QPushButton"]``.
+            If given, only the rules that can match those classes and the classes they inherit
+            are rendered, which is faster for Qt to apply. If ``auto``, the classes of the
+            widgets of the application are used. The popups Qt creates on demand, such as menus
+            and the views of combo boxes, are included, but widgets of other classes created
+            later are not styled. If None, the whole stylesheet.
+        optimize: If True, empty rules and overridden declarations are removed and rules with
+            the same declarations are merged, so that Qt parses a smaller stylesheet. See
+            :func:`optimize_stylesheet`.
+        persist: If True, a rendered stylesheet is written to the disk cache, so that later
+            processes load it instead of rendering it. Pass False for stylesheets that are only
+            previewed, such as the colors under the cursor of a color picker.
 
     Raises:
         ValueError: If the arguments of this method is wrong.
         KeyError: If the color id of custom_colors is wrong.
 
     Returns:
-        The stylesheet string for the given arguments.
+        The stylesheet string for the given arguments. Stylesheets are memoized by the arguments
+        and whether the standard icons stylesheet is included. See :func:`clear_cache`.
+        The built-in themes and accents are served pre-rendered, and other stylesheets are
+        written to the disk cache when they are first rendered and reused by later processes.
 
     Examples:
         Set stylesheet to your Qt application.
@@ -121,32 +329,316 @@ def load_stylesheet(
                     },
                 )
             )
+
+        7. Only the rules of the widgets in use ::
+
+            window.show()
+            app.setStyleSheet(qdarktheme.load_stylesheet(widget_classes="auto"))
     """
-    color_values = _color_values(theme)
-    if corner_shape not in ("rounded", "sharp"):
-        raise ValueError('invalid argument, not a rounded or sharp: "{}"'.format(corner_shape))
+    with_icons = _use_icons_stylesheet()
+    widget_classes = _canonical_widget_classes(widget_classes, with_icons)
+    stylesheet = _load_stylesheet(
+        theme, corner_shape, _canonical_custom_colors(custom_colors), with_icons, widget_classes, optimize, persist
+    )
+    prewarmer = _prewarmer
+    if prewarmer is not None and widget_classes is None:
+        prewarmer.schedule(theme, corner_shape, custom_colors, with_icons)
+    return stylesheet
 
-    if custom_colors is not None:
-        _marge_colors(color_values, custom_colors, theme)
-    try:
-        get_cash_root_path(__version__).mkdir(parents=True, exist_ok=True)
-    except:
-        pass
 
-    stylesheet = _resources.stylesheets.TEMPLATE_STYLESHEET
-    try:
-        from qdarktheme.qtpy.QtCore import QCoreApplication
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="qdarktheme")
+        return _executor
 
-        app = QCoreApplication.instance()
-        if app is not None and not app.property("_qdarktheme_use_setup_style"):
-            stylesheet += _resources.stylesheets.TEMPLATE_STANDARD_ICONS_STYLESHEET
-    except Exception:  # noqa: PIE786
-        pass
 
-    # Build stylesheet
-    template = Template(
-        stylesheet,
-        {"color": filter.color, "corner": filter.corner, "env": filter.env, "url": filter.url},
+def load_stylesheet_async(
+    theme = "dark",
+    corner_shape = "rounded",
+    custom_colors = None,
+    default_theme = "dark",
+    widget_classes = None,
+    optimize = False,
+    persist = True,
+):
+    """Render the stylesheet on a worker thread.
+
+    Takes the same arguments as :func:`load_stylesheet`, which are read before returning, so
+    later changes of ``custom_colors`` do not affect the result. The stylesheet is shared with the
+    cache of :func:`load_stylesheet`.
+
+    Returns:
+        ``concurrent.futures.Future`` of the stylesheet string. Wrap it with
+        ``asyncio.wrap_future`` to await it.
+
+    Examples:
+        Render the light theme without blocking ::
+
+            future = qdarktheme.load_stylesheet_async("light")
+            ...
+            app.setStyleSheet(future.result())
+    """
+    custom_colors_key = _canonical_custom_colors(custom_colors)
+    # Qt objects are only queried from the calling thread.
+    with_icons = _use_icons_stylesheet()
+    widget_classes = _canonical_widget_classes(widget_classes, with_icons)
+    return _get_executor().submit(
+        _load_stylesheet, theme, corner_shape, custom_colors_key, with_icons, widget_classes, optimize, persist
+    )
+
+
+def set_stylesheet_async(
+    target,
+    theme = "dark",
+    corner_shape = "rounded",
+    custom_colors = None,
+    default_theme = "dark",
+    callback = None,
+    widget_classes = None,
+    optimize = False,
+    persist = True,
+):
+    """Render the stylesheet on a worker thread and set it to ``target`` on the GUI thread.
+
+    The stylesheet is delivered through a queued Qt signal, so this has to be called from the
+    thread ``target`` lives in. If it is called again for the same target before the previous
+    stylesheet arrives, only the latest stylesheet is set.
+
+    Args:
+        target: QApplication or QWidget to call ``setStyleSheet`` of.
+        theme: The theme name. See :func:`load_stylesheet`.
+        corner_shape: The corner shape. See :func:`load_stylesheet`.
+        custom_colors: The custom color map. See :func:`load_stylesheet`.
+        default_theme: The default theme name. See :func:`load_stylesheet`.
+        callback: Function called with the stylesheet on the GUI thread after it is set.
+        widget_classes: The class names of the widgets to style. See :func:`load_stylesheet`.
+        optimize: If True, the stylesheet is optimized. See :func:`load_stylesheet`.
+        persist: If True, the stylesheet is written to the disk cache. See :func:`load_stylesheet`.
+
+    Returns:
+        ``concurrent.futures.Future`` of the stylesheet string.
+
+    Examples:
+        Switch the theme of the application without freezing it ::
+
+            qdarktheme.set_stylesheet_async(app, "light")
+    """
+    from qdarktheme._delivery import StylesheetDelivery
+
+    future = load_stylesheet_async(
+        theme, corner_shape, custom_colors, default_theme, widget_classes, optimize, persist
     )
-    replacements = dict(color_values, **{"corner-shape": corner_shape})
-    return template.render(replacements)
+    StylesheetDelivery(target, future, callback)
+    return future
+
+
+def apply_to(
+    widget,
+    theme = "dark",
+    corner_shape = "rounded",
+    custom_colors = None,
+    default_theme = "dark",
+    optimize = True,
+) -> str:
+    """Set the stylesheet of only the widget classes in the subtree of ``widget`` to ``widget``.
+
+    Unlike setting the whole stylesheet to the application, Qt only matches the rules of the
+    classes in use, and restyling the widget does not repolish the other windows. The popups Qt
+    creates on demand, such as menus, are included, but widgets of other classes added to the
+    subtree later are not styled until this is called again.
+
+    Args:
+        widget: The QWidget, usually a top-level window, to set the stylesheet to.
+        theme: The theme name. See :func:`load_stylesheet`.
+        corner_shape: The corner shape. See :func:`load_stylesheet`.
+        custom_colors: The custom color map. See :func:`load_stylesheet`.
+        default_theme: The default theme name. See :func:`load_stylesheet`.
+        optimize: If True, the stylesheet is optimized. See :func:`load_stylesheet`.
+
+    Raises:
+        ValueError: If the arguments of this method is wrong.
+        KeyError: If the color id of custom_colors is wrong.
+
+    Returns:
+        The stylesheet set to ``widget``. It is not written to the disk cache, since the widget
+        classes of each subtree differ.
+
+    Examples:
+        Theme a translation overlay only ::
+
+            overlay = TranslationOverlay()
+            qdarktheme.apply_to(overlay, "dark")
+    """
+    stylesheet = load_stylesheet(
+        theme,
+        corner_shape,
+        custom_colors,
+        default_theme,
+        widget_classes=used_widget_classes(widget),
+        optimize=optimize,
+        persist=False,
+    )
+    widget.setStyleSheet(stylesheet)
+    return stylesheet
+
+
+def iter_stylesheet(
+    theme = "dark",
+    corner_shape = "rounded",
+    custom_colors = None,
+    default_theme = "dark",
+    widget_classes = None,
+):
+    """Iterate the chunks of the stylesheet in order instead of building the whole string.
+
+    Takes the same arguments as :func:`load_stylesheet`. Joining the chunks gives the same
+    string as :func:`load_stylesheet`.
+
+    Examples:
+        Export a stylesheet to a file ::
+
+            with open("dark.qss", "w") as f:
+                f.writelines(qdarktheme.iter_stylesheet("dark"))
+    """
+    with_icons = _use_icons_stylesheet()
+    sections, replacements = _stylesheet_sources(
+        theme,
+        corner_shape,
+        _canonical_custom_colors(custom_colors),
+        with_icons,
+        _canonical_widget_classes(widget_classes, with_icons),
+    )
+    return chain.from_iterable(
+        _stylesheet_template(theme, text, plan).render_iter(replacements)
+        for text, plan in sections
+    )
+
+
+def write_stylesheet(
+    fp,
+    theme = "dark",
+    corner_shape = "rounded",
+    custom_colors = None,
+    default_theme = "dark",
+    widget_classes = None,
+) -> None:
+    """Write the stylesheet to the file object ``fp`` chunk by chunk.
+
+    Takes the same arguments as :func:`load_stylesheet` after ``fp``.
+    """
+    for chunk in iter_stylesheet(theme, corner_shape, custom_colors, default_theme, widget_classes):
+        fp.write(chunk)
+
+
+def optimize_stylesheet(stylesheet) -> OptimizedStylesheet:
+    """Remove the waste of a rendered stylesheet and report the savings.
+
+    Rules whose declarations all only exist for other Qt versions are removed, while the rules
+    the template leaves empty on purpose are kept. Declarations overridden later in the same
+    rule are dropped, and the selectors of rules with the same declarations are merged where
+    the cascade allows it.
+
+    Args:
+        stylesheet: The stylesheet text, such as the output of :func:`load_stylesheet`.
+
+    Returns:
+        OptimizedStylesheet holding the optimized ``stylesheet`` and its ``metrics()``, which
+        are the byte and rule counts before and after and the count of each rewrite.
+
+    Examples:
+        Check how much smaller the stylesheet gets ::
+
+            result = qdarktheme.optimize_stylesheet(qdarktheme.load_stylesheet())
+            print(result.metrics()["saved_bytes"])
+    """
+    return OptimizedStylesheet(stylesheet, _template_empty_selectors())
+
+
+def diff_stylesheets(old, new) -> RuleDiff:
+    """Compare two stylesheets rule by rule.
+
+    Args:
+        old: The current stylesheet. Either a rendered stylesheet or a dict of
+            :func:`load_stylesheet` arguments. Stylesheets rendered for the comparison are not
+            written to the disk cache.
+        new: The next stylesheet, in the same forms as ``old``.
+
+    Returns:
+        RuleDiff holding the changed, added and removed selector blocks and their counts.
+
+    Examples:
+        Check how many rules an accent change touches ::
+
+            diff = qdarktheme.diff_stylesheets(
+                {"theme": "dark"}, {"theme": "dark", "custom_colors": {"primary": "#D0BCFF"}}
+            )
+            print(diff.metrics()["changed"])
+    """
+    old, new = (
+        stylesheet if isinstance(stylesheet, str) else load_stylesheet(**dict(stylesheet, persist=False))
+        for stylesheet in (old, new)
+    )
+    return RuleDiff(old, new)
+
+
+def audit_contrast(
+    theme = "dark",
+    custom_colors = None,
+    min_ratio = 4.5,
+    include_disabled = False,
+) -> list:
+    """Check the contrast of every text color the stylesheet draws on its background.
+
+    The foreground/background pairs are read from the declarations of each selector of the
+    template, and the WCAG contrast ratios are computed from the resolved color table without
+    rendering the stylesheet.
+
+    Args:
+        theme: The theme name. There are `dark` and `light`.
+        custom_colors: The custom color map. Overrides the default color for color id you set.
+        min_ratio: The minimum contrast ratio. WCAG AA requires 4.5 for normal text.
+        include_disabled: If True, also checks the colors of disabled widgets, which WCAG does
+            not require to be readable.
+
+    Raises:
+        ValueError: If the arguments of this method is wrong.
+        KeyError: If the color id of custom_colors is wrong.
+
+    Returns:
+        List of ContrastIssue, having ``selector``, ``property``, ``foreground``,
+        ``background`` and ``ratio``, for the pairs below ``min_ratio``.
+
+    Examples:
+        Warn about an unreadable accent ::
+
+            for issue in qdarktheme.audit_contrast(custom_colors={"primary": "#ffeb3b"}):
+                print(issue.selector, issue.ratio)
+    """
+    return audit_color_table(load_color_table(theme, custom_colors), min_ratio, include_disabled)
+
+
+def load_palette(
+    theme = "dark",
+    custom_colors = None,
+    for_stylesheet = False,
+):
+    """Load the QPalette for the dark or light theme.
+
+    Args:
+        theme: The theme name. There are `dark` and `light`.
+        custom_colors: The custom color map. Overrides the default color for color id you set.
+        for_stylesheet: If True, only includes colors that cannot be set by stylesheets,
+            such as ``link`` and ``placeholder``.
+
+    Raises:
+        ValueError: If the ``theme`` argument is wrong.
+        KeyError: If the color id of custom_colors is wrong.
+
+    Returns:
+        The QPalette for the given arguments.
+    """
+    color_table = load_color_table(theme, custom_colors)
+    mk_template = partial(get_template, filters=_PALETTE_FILTERS)
+    return _resources.palette.q_palette(mk_template, color_table.replacements, for_stylesheet)
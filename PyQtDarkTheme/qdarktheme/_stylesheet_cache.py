@@ -0,0 +1,97 @@
+"""Module for caching rendered stylesheets on disk across processes.
+
+At most ``MAX_STYLESHEETS`` stylesheets are kept, the least recently used being removed first.
+"""
+
+import hashlib
+import os
+import platform
+import re
+
+from qdarktheme import __version__
+from qdarktheme._template import filter
+from qdarktheme._template.engine import _text_hash
+from qdarktheme._util import get_cash_root_path, get_logger, write_file_atomically
+
+_logger = get_logger(__name__)
+
+_HEADER = "/* qdarktheme-stylesheet {} {} */\n"
+_HEADER_RE = re.compile(r"/\* qdarktheme-stylesheet (\w+) (\w+) \*/\n")
+_URL_RE = re.compile(r"url\(([^)]*)\)")
+MAX_STYLESHEETS = 32
+
+
+def stylesheet_key(template_texts, color_table, corner_shape) -> str:
+    """Return the hash of everything the rendered stylesheet depends on.
+
+    That is the template texts, the resolved colors, the corner shape, the Qt binding, Qt version
+    and OS read by ``filter.env`` and the cache root the ``url`` filter writes to.
+    """
+    facts = [_text_hash(text) for text in template_texts]
+    facts += ["{}={}".format(key, value) for key, value in sorted(color_table.strings.items())]
+    facts += [
+        corner_shape,
+        filter._QT_API,
+        filter._QT_VERSION,
+        platform.system(),
+        get_cash_root_path(__version__).as_posix(),
+    ]
+    return hashlib.sha1("\n".join(facts).encode()).hexdigest()
+
+
+def _cache_path(key):
+    return get_cash_root_path(__version__) / "stylesheet_{}.qss".format(key)
+
+
+def load_stylesheet(key):
+    """Load the stylesheet cached on disk. Return None if it is missing, stale or broken.
+
+    The header of the file holds the key and the hash of the stylesheet, and the svg files the
+    stylesheet refers to have to exist.
+    """
+    try:
+        with open(str(_cache_path(key)), encoding="utf-8", newline="") as f:
+            data = f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+    match = _HEADER_RE.match(data)
+    if match is None or match.group(1) != key:
+        return None
+    stylesheet = data[match.end() :]
+    if match.group(2) != _text_hash(stylesheet):
+        return None
+    if not all(os.path.exists(path) for path in set(_URL_RE.findall(stylesheet))):
+        return None
+    try:
+        os.utime(str(_cache_path(key)))  # Mark as recently used for pruning.
+    except OSError:
+        pass
+    return stylesheet
+
+
+def dump_stylesheet(key, stylesheet) -> None:
+    """Write the stylesheet to disk atomically, removing the least recently used ones over the cap.
+
+    This does file IO, so it is meant to run on a worker thread.
+    """
+    try:
+        write_file_atomically(_cache_path(key), _HEADER.format(key, _text_hash(stylesheet)) + stylesheet)
+    except OSError as e:
+        _logger.warning("Failed to write stylesheet cache: {}".format(e))
+        return
+    _prune()
+
+
+def _prune() -> None:
+    paths = []
+    for path in get_cash_root_path(__version__).glob("stylesheet_*.qss"):
+        try:
+            paths.append((path.stat().st_mtime, path))
+        except OSError:
+            pass
+    paths.sort(reverse=True)
+    for _, path in paths[MAX_STYLESHEETS:]:
+        try:
+            os.remove(str(path))
+        except OSError:
+            pass
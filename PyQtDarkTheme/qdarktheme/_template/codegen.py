@@ -0,0 +1,123 @@
+"""Template backend that compiles template text into a generated Python function."""
+
+import marshal
+import sys
+from importlib.util import MAGIC_NUMBER
+
+from qdarktheme import __version__
+from qdarktheme._template.engine import Template, _text_hash
+from qdarktheme._util import get_cash_root_path, get_logger, write_file_atomically
+
+_logger = get_logger(__name__)
+
+# Bump when the generated source changes so that stale cache files are not loaded.
+_CODEGEN_VERSION = 2
+
+
+def _generate_source(compiled) -> str:
+    """Generate the source of the module defining ``render(r)`` for the compiled template.
+
+    ``render`` returns the same pieces as ``Template._render_pieces``. Every distinct filter chain
+    prefix is evaluated once, so ``background|color`` is shared by all placeholders starting
+    with it.
+    """
+    header, body = [], []
+    names = {}
+    filter_names = sorted({call.name for p in compiled.placeholders for call in p.filters})
+    for name in filter_names:
+        header.append("_f_{0} = _filters[{0!r}]".format(name))
+
+    slot_names = []
+    for index, placeholder in enumerate(compiled.placeholders):
+        value = placeholder.value
+        if type(value) is str and len(value) != 0:
+            key = ("id", value)
+            if key not in names:
+                names[key] = "v{}".format(len(names))
+                body.append("    {} = r[{!r}]".format(names[key], value))
+        else:
+            key = ("literal", value)
+            names[key] = repr(value)
+        for call in placeholder.filters:
+            prev_name = names[key]
+            key = key + (call.name, tuple(sorted(call.kwargs.items())))
+            if key not in names:
+                names[key] = "v{}".format(len(names))
+                arguments = "".join(", {}={!r}".format(k, v) for k, v in sorted(call.kwargs.items()))
+                body.append("    {} = _f_{}({}{})".format(names[key], call.name, prev_name, arguments))
+        slot_names.append("s{}".format(index))
+        body.append("    {} = str({})".format(slot_names[-1], names[key]))
+
+    pieces = [repr(piece) for piece in compiled.pieces]
+    for position, index in compiled.slots:
+        pieces[position] = slot_names[index]
+
+    return "\n".join(
+        header
+        + ["_REQUIRED = {!r}".format(tuple(sorted(compiled.required_ids))), "", "", "def render(r):"]
+        + [
+            "    missing = [id for id in _REQUIRED if r.get(id) is None]",
+            "    if missing:",
+            '        raise AssertionError("There is no replacements for: {}".format(", ".join(missing)))',
+        ]
+        + body
+        + ["    return [{}]".format(", ".join(pieces)), ""]
+    )
+
+
+def _cache_path(text):
+    cache_tag = sys.implementation.cache_tag or "py{}{}".format(*sys.version_info[:2])
+    return get_cash_root_path(__version__) / "template_{}_{}.{}.pyc".format(
+        _text_hash(text), _CODEGEN_VERSION, cache_tag
+    )
+
+
+def _load_code(path):
+    """Load the code object cached on disk. Return None if it is missing or stale."""
+    try:
+        with open(str(path), "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if data[: len(MAGIC_NUMBER)] != MAGIC_NUMBER:
+        return None
+    try:
+        return marshal.loads(data[len(MAGIC_NUMBER) :])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def _dump_code(path, code) -> None:
+    """Write the code object to disk atomically."""
+    try:
+        write_file_atomically(path, MAGIC_NUMBER + marshal.dumps(code))
+    except OSError as e:
+        _logger.warning("Failed to write template cache: {}".format(e))
+
+
+class CodeTemplate(Template):
+    """Template backend that compiles template text into a generated Python function.
+
+    The code object of the generated function is cached on disk under the versioned cache root,
+    so later processes load it without parsing the template text.
+    """
+
+    def __init__(self, text: str, filters: dict, plan=None):
+        """Initialize CodeTemplate class."""
+        super().__init__(text, filters, plan)
+        path = _cache_path(text)
+        code = _load_code(path)
+        if code is None:
+            source = _generate_source(self._compiled)
+            code = compile(source, "<qdarktheme template {}>".format(path.stem), "exec")
+            _dump_code(path, code)
+        namespace = {"_filters": filters}
+        exec(code, namespace)
+        self._render_func = namespace["render"]
+
+    def _render_pieces(self, replacements) -> list:
+        return self._render_func(replacements)
+
+    def render_iter(self, replacements):
+        """Render replacements, yielding the rendered chunks in order without joining them."""
+        return iter(self._render_func(replacements))
@@ -1,10 +1,41 @@
 """Module for handling template text."""
 
+import hashlib
 import json
 import re
+import threading
+from collections import OrderedDict
 from itertools import chain, zip_longest
 
-from qdarktheme._util import multi_replace
+
+_FILTER_MEMO_MAXSIZE = 4096
+# Shared by render threads without a lock. Single dict operations are atomic, and a race at worst
+# computes a pure filter twice or clears entries another thread has just added.
+_FILTER_MEMO = {}
+
+
+def _text_hash(text) -> str:
+    """Return the hash of template source text used as a cache key."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _freeze(value):
+    """Convert the replacement value to a hashable key for the filter memo."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(child)) for key, child in value.items()))
+    return (type(value).__name__, value)
+
+
+def _flatten_ids(replacements) -> dict:
+    """Flatten replacements to color ids such as ``background`` and ``background>popup``."""
+    ids = {}
+    for key, value in replacements.items():
+        if isinstance(value, dict):
+            for child_key, child_value in value.items():
+                ids[key if child_key == "base" else "{}>{}".format(key, child_key)] = child_value
+        else:
+            ids[key] = value
+    return ids
 
 
 class _Placeholder:
@@ -12,6 +43,110 @@ class _Placeholder:
         self.match_text = _1
         self.value = _2
         self.filters = _3
+        self.dependencies = frozenset()
+        if type(_2) is str and len(_2) != 0:
+            # A state argument such as color(state="popup") reads the "background>popup" id.
+            states = (call.kwargs["state"] for call in _3 if "state" in call.kwargs)
+            self.dependencies = frozenset(chain([_2], ("{}>{}".format(_2, state) for state in states)))
+
+
+class _FilterCall:
+    """Filter invocation resolved at compile time into the filter function and its arguments."""
+
+    def __init__(self, name, func, kwargs):
+        self.name = name
+        self.func = func
+        self.kwargs = kwargs
+        self.pure = getattr(func, "is_pure", False)
+        self.key = (func, tuple(sorted(kwargs.items())))
+
+    def __call__(self, value):
+        return self.func(value, **self.kwargs)
+
+
+class _CompiledTemplate:
+    """Template text split into literal segments and placeholder slots.
+
+    ``pieces`` keeps the literal segments in order, with ``None`` at the position of each slot.
+    ``slots`` maps those positions to indexes of ``placeholders``, which holds every distinct
+    placeholder once, so a placeholder used many times is evaluated only once per render.
+    ``positions`` is the reverse map, listing the slot positions of each placeholder.
+
+    The compiled template is built from a render plan, which is plain data and can be
+    serialized. See :meth:`parse` for its format.
+    """
+
+    def __init__(self, text, filters, plan=None):
+        self.plan = _CompiledTemplate.parse(text) if plan is None else plan
+        self.required_ids = frozenset(self.plan["required"])
+        self.placeholders = []
+        calls = {}
+        for match_text, value, filter_specs in self.plan["placeholders"]:
+            for name, kwargs in filter_specs:
+                key = (name, tuple(sorted(kwargs.items())))
+                if key not in calls:
+                    calls[key] = _FilterCall(name, filters[name], kwargs)
+            filter_calls = tuple(
+                calls[(name, tuple(sorted(kwargs.items())))] for name, kwargs in filter_specs
+            )
+            self.placeholders.append(_Placeholder(match_text, value, filter_calls))
+
+        self.pieces = []
+        self.slots = []
+        self.positions = [[] for _ in self.placeholders]
+        literals = self.plan["literals"]
+        for (start, end), index in zip(literals, self.plan["slots"]):
+            self.pieces.append(text[start:end])
+            self.positions[index].append(len(self.pieces))
+            self.slots.append((len(self.pieces), index))
+            self.pieces.append(None)
+        start, end = literals[-1]
+        self.pieces.append(text[start:end])
+
+    @staticmethod
+    def parse(text) -> dict:
+        """Parse template text into a render plan.
+
+        The plan is a dict of:
+            hash: Hash of the template text the plan belongs to.
+            literals: ``(start, end)`` offsets of the literal segments around the slots.
+            slots: Index into ``placeholders`` for each slot in order.
+            placeholders: ``(match text, value, ((filter name, kwargs), ...))`` of each
+                distinct placeholder.
+            required: Replacement ids read by the placeholders.
+        """
+        literals, slots, placeholders, required = [], [], [], []
+        indexes = {}
+        position = 0
+        for match in Template._PLACEHOLDER_RE.finditer(text):
+            literals.append((position, match.start()))
+            match_text = match.group()
+            index = indexes.get(match_text)
+            if index is None:
+                contents, *filter_texts = match_text.strip("{}").replace(" ", "").split("|")
+                value = Template._to_py_value(contents)
+                if type(value) is str and len(value) != 0 and value not in required:
+                    required.append(value)
+                filter_specs = tuple(Template._parse_filter(filter_text) for filter_text in filter_texts)
+                index = indexes[match_text] = len(placeholders)
+                placeholders.append((match_text, value, filter_specs))
+            slots.append(index)
+            position = match.end()
+        literals.append((position, len(text)))
+        return {
+            "hash": _text_hash(text),
+            "literals": tuple(literals),
+            "slots": tuple(slots),
+            "placeholders": tuple(placeholders),
+            "required": tuple(required),
+        }
+
+    def fill(self, values) -> list:
+        """Return literal segments filled with the rendered values of placeholders."""
+        pieces = list(self.pieces)
+        for position, index in self.slots:
+            pieces[position] = values[index]
+        return pieces
 
 
 class Template:
@@ -20,10 +155,41 @@ class Template:
     _PLACEHOLDER_RE = re.compile(r"{{.*?}}")
     _STRING_RE = re.compile(r"""('([^'\\]*(?:\\.[^'\\]*)*)'|"([^"\\]*(?:\\.[^"\\]*)*)")""", re.S)
 
-    def __init__(self, text: str, filters: dict):
-        """Initialize Template class."""
+    def __init__(self, text: str, filters: dict, plan=None):
+        """Initialize Template class.
+
+        Args:
+            text: The template text.
+            filters: Map of filter name to filter function.
+            plan: The render plan of ``text`` prebuilt by ``_CompiledTemplate.parse``.
+                Used instead of parsing ``text`` if it belongs to the same text.
+        """
         self._target_text = text
         self._filters = filters
+        self._plan = plan
+        self._compiled_template = None
+        # (color ids, pieces) of the last incremental render, replaced as a whole so that
+        # threads rendering concurrently always read a consistent pair.
+        self._last_render = None
+
+    @property
+    def _compiled(self) -> _CompiledTemplate:
+        if self._compiled_template is None:
+            plan = self._plan
+            if plan is not None and plan["hash"] != _text_hash(self._target_text):
+                plan = None
+            self._compiled_template = _CompiledTemplate(self._target_text, self._filters, plan)
+        return self._compiled_template
+
+    @property
+    def required_ids(self) -> frozenset:
+        """Return the replacement ids the template reads."""
+        return self._compiled.required_ids
+
+    def _check_replacements(self, replacements) -> None:
+        missing = [id for id in self._compiled.required_ids if replacements.get(id) is None]
+        if missing:
+            raise AssertionError("There is no replacements for: {}".format(", ".join(sorted(missing))))
 
     @staticmethod
     def _to_py_value(text: str):
@@ -36,19 +202,11 @@ class Template:
                 return text
 
     @staticmethod
-    def _parse_placeholders(text):
-        placeholders = set()
-        for match in re.finditer(Template._PLACEHOLDER_RE, text):
-            match_text = match.group()
-            contents, *filters = match_text.strip("{}").replace(" ", "").split("|")
-            value = Template._to_py_value(contents)
-            placeholders.add(_Placeholder(match_text, value, tuple(filters)))
-        return placeholders
-
-    def _run_filter(self, value, filter_text):
+    def _parse_filter(filter_text):
+        """Parse filter text such as ``url(id="arrow_upward",rotate=270)`` to name and kwargs."""
         contents = filter_text.split("(")
         if len(contents) == 1:
-            return self._filters[contents[0]](value)
+            return contents[0], {}
 
         filter_name, arg_text = contents
         py_strings = [match.group() for match in Template._STRING_RE.finditer(arg_text)]
@@ -61,22 +219,149 @@ class Template:
             json_text = '{"' + "".join(
                 chain.from_iterable(zip_longest(words, py_strings, fillvalue=""))
             )
-        arguments = json.loads(json_text)
-        return self._filters[filter_name](value, **arguments)
+        return filter_name, json.loads(json_text)
+
+    @staticmethod
+    def _run_filters(value, key, filter_calls):
+        """Run the filter chain, memoizing pure filters by the key of their input."""
+        for filter_call in filter_calls:
+            if key is None or not filter_call.pure:
+                key = None
+                value = filter_call(value)
+                continue
+            key = (filter_call.key, key)
+            try:
+                value = _FILTER_MEMO[key]
+            except KeyError:
+                value = filter_call(value)
+                if len(_FILTER_MEMO) >= _FILTER_MEMO_MAXSIZE:
+                    _FILTER_MEMO.clear()
+                _FILTER_MEMO[key] = value
+        return value
+
+    def _render_placeholder(self, placeholder, replacements, frozen_values) -> str:
+        # Replacements are checked against the required ids before rendering.
+        value = placeholder.value
+        if type(value) is str and len(value) != 0:
+            value = replacements[value]
+            key = frozen_values.get(placeholder.value)
+            if key is None:
+                key = frozen_values[placeholder.value] = _freeze(value)
+        else:
+            key = _freeze(value)
+        return str(Template._run_filters(value, key, placeholder.filters))
+
+    def _render_pieces(self, replacements) -> list:
+        self._check_replacements(replacements)
+        frozen_values = {}
+        values = [
+            self._render_placeholder(placeholder, replacements, frozen_values)
+            for placeholder in self._compiled.placeholders
+        ]
+        return self._compiled.fill(values)
 
     def render(self, replacements) -> str:
         """Render replacements."""
-        placeholders = Template._parse_placeholders(self._target_text)
-        new_replacements = {}
-        for placeholder in placeholders:
-            value = placeholder.value
-            if type(value) is str and len(value) != 0:
-                value = replacements.get(value)
-            if value is None:
-                raise AssertionError(
-                    "There is no replacements for: {} in {}".format(placeholder.value, placeholder.match_text)
+        return "".join(self._render_pieces(replacements))
+
+    def render_iter(self, replacements):
+        """Render replacements, yielding the rendered chunks in order without joining them."""
+        compiled = self._compiled
+        self._check_replacements(replacements)
+        frozen_values = {}
+        values = [None] * len(compiled.placeholders)
+        for position, index in compiled.slots:
+            yield compiled.pieces[position - 1]
+            if values[index] is None:
+                values[index] = self._render_placeholder(
+                    compiled.placeholders[index], replacements, frozen_values
                 )
-            for filter in placeholder.filters:
-                value = self._run_filter(value, filter)
-            new_replacements[placeholder.match_text] = str(value)
-        return multi_replace(self._target_text, new_replacements)
+            yield values[index]
+        yield compiled.pieces[-1]
+
+    def render_to(self, fp, replacements) -> None:
+        """Render replacements and write the rendered chunks to the file object ``fp``."""
+        for chunk in self.render_iter(replacements):
+            fp.write(chunk)
+
+    def render_incremental(self, replacements) -> str:
+        """Render replacements, recomputing only placeholders whose color ids changed.
+
+        The first call renders every placeholder. Later calls compare the color ids of
+        ``replacements`` with the previous call and splice the recomputed placeholders into
+        the previous output.
+        """
+        ids = _flatten_ids(replacements)
+        last_render = self._last_render
+        if last_render is None:
+            pieces = self._render_pieces(replacements)
+        else:
+            self._check_replacements(replacements)
+            last_ids, last_pieces = last_render
+            pieces = list(last_pieces)
+            changed = {id for id in ids.keys() | last_ids.keys() if ids.get(id) != last_ids.get(id)}
+            frozen_values = {}
+            for index, placeholder in enumerate(self._compiled.placeholders):
+                if placeholder.dependencies.isdisjoint(changed):
+                    continue
+                value = self._render_placeholder(placeholder, replacements, frozen_values)
+                for position in self._compiled.positions[index]:
+                    pieces[position] = value
+        self._last_render = (ids, pieces)
+        return "".join(pieces)
+
+
+class _TemplateCache:
+    """Bounded LRU cache of compiled templates keyed by the hash of their source text."""
+
+    def __init__(self, maxsize):
+        """Initialize the cache holding at most ``maxsize`` templates."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._templates = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, text, filters, template_class=Template, plan=None) -> Template:
+        """Return the cached template for ``text`` and ``filters``, compiling it on a miss."""
+        key = (_text_hash(text), tuple(sorted(filters.items())), template_class)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self.hits += 1
+                self._templates.move_to_end(key)
+                return template
+            self.misses += 1
+            # Compiled under the lock so that concurrent misses share one template.
+            template = self._templates[key] = template_class(text, filters, plan)
+            if len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+            return template
+
+    def clear(self) -> None:
+        """Remove all templates and reset the counters."""
+        with self._lock:
+            self._templates.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> dict:
+        """Return the hit/miss counters and the current size of the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._templates),
+            "maxsize": self.maxsize,
+        }
+
+
+_TEMPLATE_CACHE = _TemplateCache(maxsize=64)
+
+
+def get_template(text, filters, template_class=Template, plan=None) -> Template:
+    """Return a compiled template shared across the process."""
+    return _TEMPLATE_CACHE.get(text, filters, template_class, plan)
+
+
+def template_cache_info() -> dict:
+    """Return the statistics of the process-wide template cache."""
+    return _TEMPLATE_CACHE.info()
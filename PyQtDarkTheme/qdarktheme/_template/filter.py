@@ -5,7 +5,7 @@ import platform
 from qdarktheme import __version__
 from qdarktheme._color import Color
 from qdarktheme._icon.svg import Svg
-from qdarktheme._util import analyze_version_str, get_cash_root_path, get_logger
+from qdarktheme._util import analyze_version_str, get_cash_root_path, get_logger, write_file_atomically
 from qdarktheme.qtpy import __version__ as qt_version
 from qdarktheme.qtpy.qt_compat import QT_API
 
@@ -32,6 +32,12 @@ if None in (qt_version, QT_API):
     )
 
 
+def _pure(func):
+    """Mark the filter as pure so that the template engine can memoize its results."""
+    func.is_pure = True
+    return func
+
+
 def _transform(color, color_state) -> Color:
     if color_state.get("transparent"):
         color = color.transparent(color_state["transparent"])
@@ -42,11 +48,21 @@ def _transform(color, color_state) -> Color:
     return color
 
 
+@_pure
 def color(color_info, state=None) -> Color:
-    """Filter for template engine. This filter convert color info data to color object."""
+    """Filter for template engine. This filter convert color info data to color object.
+
+    Color info already resolved by ``ColorTable`` holds Color objects, which are returned as is.
+    """
+    if isinstance(color_info, Color):
+        return color_info
     if isinstance(color_info, str):
         return Color.from_hex(color_info)
 
+    resolved = color_info["base" if state is None else state]  # type: ignore
+    if isinstance(resolved, Color):
+        return resolved
+
     base_color_format = color_info["base"]  # type: ignore
     color = Color.from_hex(base_color_format)
 
@@ -61,6 +77,7 @@ def color(color_info, state=None) -> Color:
     )
 
 
+@_pure
 def palette_format(color: Color) -> str:
     """Filter for template engine. This filter convert color object to ARGB hex format.
 
@@ -79,11 +96,12 @@ def url(color: Color, id, rotate: int = 0) -> str:
     if svg_path.exists():
         return url
     svg = Svg(id).colored(color).rotate(rotate)
-    with open(str(svg_path), "w") as ff:
-        ff.write(str(svg))
+    # Written atomically, since another thread may render the same svg at the same time.
+    write_file_atomically(svg_path, str(svg))
     return url
 
 
+@_pure
 def env(text, value, version=None, qt=None, os=None) -> str:
     """Filter for template engine. This filter output empty string when unexpected environment."""
     if version and not analyze_version_str(_QT_VERSION, version):
@@ -95,6 +113,7 @@ def env(text, value, version=None, qt=None, os=None) -> str:
     return value.replace("${}", str(text))
 
 
+@_pure
 def corner(corner_shape, size) -> str:
     """Filter for template engine. This filter manage corner shape."""
     return size if corner_shape == "rounded" else "0"
@@ -0,0 +1,115 @@
+"""Module for the long-lived state of a base theme."""
+
+import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from qdarktheme import _resources
+from qdarktheme._color_table import ColorTable
+from qdarktheme._template.engine import _TemplateCache
+
+
+def _mix_theme_colors(custom_colors, theme):
+    colors = {id: color for id, color in custom_colors.items() if isinstance(color, str)}
+    custom_colors_with_theme = custom_colors.get("[{}]".format(theme))
+    if isinstance(custom_colors_with_theme, dict):
+        colors.update(custom_colors_with_theme)
+    elif isinstance(custom_colors_with_theme, str):
+        raise ValueError(
+            "invalid value for argument custom_colors, not a dict type: "
+            '"{}" of "[{}]" key.'.format(custom_colors_with_theme, theme)
+        )
+    return colors
+
+
+class ThemeContext:
+    """The colors of a base theme parsed once, and the caches derived from them.
+
+    Custom colors are overlays on the base color values. An overlay copies only the color ids
+    it changes and shares the other subtrees, and their resolved Colors, with the base. The base
+    values are never mutated.
+    """
+
+    def __init__(self, theme, maxsize=32) -> None:
+        """Initialize ThemeContext class.
+
+        Args:
+            theme: The theme name. There are `dark` and `light`.
+            maxsize: The number of color tables of custom colors, and of templates, to keep.
+
+        Raises:
+            ValueError: If the ``theme`` argument is wrong.
+        """
+        try:
+            text = _resources.colors.THEME_COLOR_VALUES[theme]
+        except KeyError:
+            raise ValueError('invalid argument, not a dark, light or auto: "{}"'.format(theme)) from None
+        self.theme = theme
+        self.values = json.loads(text)
+        self.color_table = ColorTable(self.values)
+        self._maxsize = maxsize
+        self._tables = OrderedDict()
+        self._templates = _TemplateCache(maxsize)
+        self._lock = threading.Lock()
+
+    def overlay(self, custom_colors) -> dict:
+        """Return the color values with custom_colors applied on top of the base values.
+
+        Raises:
+            ValueError: If the value of a ``[theme]`` key is not a dict.
+            KeyError: If the color id of custom_colors is wrong.
+        """
+        values = dict(self.values)
+        copied = set()
+        for color_id, color in _mix_theme_colors(custom_colors, self.theme).items():
+            try:
+                parent_key, *child_keys = color_id.split(">")
+                color_value = values[parent_key]
+                if len(child_keys) > 1 or (isinstance(color_value, str) and len(child_keys) != 0):
+                    raise KeyError
+
+                if isinstance(color_value, str):
+                    values[parent_key] = color
+                else:
+                    child_key = "base" if len(child_keys) == 0 else child_keys[0]
+                    color_value[child_key]  # Check if child_key exists.
+                    if parent_key not in copied:
+                        color_value = values[parent_key] = dict(color_value)
+                        copied.add(parent_key)
+                    color_value[child_key] = color
+            except KeyError:
+                raise KeyError('invalid color id for argument custom_colors: "{}".'.format(color_id)) from None
+        return values
+
+    def get_color_table(self, custom_colors_key) -> ColorTable:
+        """Return the ColorTable of the canonical JSON text of custom_colors, resolving it once."""
+        with self._lock:
+            table = self._tables.get(custom_colors_key)
+            if table is not None:
+                self._tables.move_to_end(custom_colors_key)
+                return table
+        custom_colors = json.loads(custom_colors_key)
+        if custom_colors is None:
+            table = self.color_table
+        else:
+            table = ColorTable(self.overlay(custom_colors), base=self.color_table)
+        with self._lock:
+            self._tables[custom_colors_key] = table
+            if len(self._tables) > self._maxsize:
+                self._tables.popitem(last=False)
+        return table
+
+    def get_template(self, text, filters, template_class, plan=None):
+        """Return the template of this theme for ``text``.
+
+        Templates are not shared between themes, so incremental renders of a theme only
+        recompute the placeholders its custom colors change.
+        """
+        return self._templates.get(text, filters, template_class, plan)
+
+
+@lru_cache(maxsize=None)
+def get_theme_context(theme) -> ThemeContext:
+    """Return the ThemeContext of the theme shared across the process."""
+    return ThemeContext(theme)
@@ -4,6 +4,7 @@ import inspect
 import logging
 import operator as ope
 import re
+import threading
 from pathlib import Path
 from collections import OrderedDict
 import qdarktheme
@@ -68,6 +69,34 @@ def get_cash_root_path(version) -> Path:
     return Path(os.path.dirname(__file__)) / "svg" / "v{}".format(version)
 
 
+def write_file_atomically(path, data) -> None:
+    """Write ``data`` to ``path`` through a temporary file, so that readers never see a partial file.
+
+    Args:
+        path: The destination path.
+        data: ``bytes``, or ``str`` written as UTF-8.
+
+    Raises:
+        OSError: If the file cannot be written. The temporary file is removed.
+    """
+    path = Path(path)
+    tmp_path = path.with_name("{}.{}.{}.tmp".format(path.name, os.getpid(), threading.get_ident()))
+    try:
+        if isinstance(data, bytes):
+            with open(str(tmp_path), "wb") as f:
+                f.write(data)
+        else:
+            with open(str(tmp_path), "w", encoding="utf-8", newline="") as f:
+                f.write(data)
+        os.replace(str(tmp_path), str(path))
+    except OSError:
+        try:
+            os.remove(str(tmp_path))
+        except OSError:
+            pass
+        raise
+
+
 def get_qdarktheme_root_path() -> Path:
     """Return the qdarktheme package root path.
 
@@ -0,0 +1,37 @@
+"""Shared fixtures of the qdarktheme tests."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import qdarktheme  # noqa: E402
+from qdarktheme import _bundle, _style_loader, _stylesheet_cache  # noqa: E402
+from qdarktheme._template import codegen, filter  # noqa: E402
+
+_CACHE_ROOT_MODULES = (_bundle, _style_loader, _stylesheet_cache, codegen, filter)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cache_root(tmp_path_factory):
+    """Write the svg files and caches of the tests to a temporary directory."""
+    root = tmp_path_factory.mktemp("qdarktheme")
+    (root / "v{}".format(qdarktheme.__version__)).mkdir()
+    originals = [module.get_cash_root_path for module in _CACHE_ROOT_MODULES]
+    for module in _CACHE_ROOT_MODULES:
+        module.get_cash_root_path = lambda version: root / "v{}".format(version)
+    yield root / "v{}".format(qdarktheme.__version__)
+    for module, get_cash_root_path in zip(_CACHE_ROOT_MODULES, originals):
+        module.get_cash_root_path = get_cash_root_path
+
+
+@pytest.fixture()
+def fresh_render(monkeypatch):
+    """Make load_stylesheet render the templates instead of reading the bundle or disk cache."""
+    monkeypatch.setattr(_bundle, "get_bundle", lambda: None)
+    monkeypatch.setattr(_stylesheet_cache, "load_stylesheet", lambda key: None)
+    qdarktheme.clear_cache()
+    yield
+    qdarktheme.clear_cache()
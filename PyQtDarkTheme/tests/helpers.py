@@ -0,0 +1,17 @@
+"""Constants shared by the qdarktheme tests."""
+
+import common
+
+THEMES = ("dark", "light")
+# (theme, accent) of every accent offered by the app.
+ACCENTS = [(theme, accent) for theme in THEMES for accent in common.ACCENT_COLORS[theme].values()]
+# (theme, accent) including the themes without custom colors.
+VARIANTS = [(theme, None) for theme in THEMES] + ACCENTS
+
+
+def replacements(theme, accent, corner_shape = "rounded") -> dict:
+    """Return the replacements ``load_stylesheet`` renders the templates with."""
+    import qdarktheme
+
+    custom_colors = None if accent is None else {"primary": accent}
+    return dict(qdarktheme.load_color_table(theme, custom_colors).replacements, **{"corner-shape": corner_shape})
@@ -0,0 +1,32 @@
+"""Tests of the accent palettes against the color tables of the loader."""
+
+import pytest
+from helpers import ACCENTS
+
+import qdarktheme
+
+_OTHER_ACCENTS = [("dark", "#123456"), ("light", "#12345680"), ("dark", "#fff"), ("light", "#000000")]
+
+
+@pytest.mark.parametrize("theme, accent", ACCENTS + _OTHER_ACCENTS)
+def test_accent_palette_matches_color_table(theme, accent):
+    table = qdarktheme.load_color_table(theme, {"primary": accent})
+    palette = qdarktheme.accent_palette(accent, theme)
+    states = [id for id in table.strings if id.startswith("primary:")]
+    assert sorted(palette) == sorted(["primary"] + [id.replace(":", ">") for id in states])
+    for id, hex_color in palette.items():
+        r, g, b, a = table[id.replace(">", ":")].rgba
+        alpha = "" if a == 1 else "{:02x}".format(round(a * 255))
+        assert hex_color == "#{:02x}{:02x}{:02x}{}".format(r, g, b, alpha)
+
+
+def test_accent_palette_rounds_alpha_to_the_nearest_byte():
+    palette = qdarktheme.accent_palette("#8ab4f7", "dark")
+    # button.activeBackground is transparent(0.23), which is 58.65 of 255.
+    assert palette["primary>button.activeBackground"].endswith("3b")
+
+
+@pytest.mark.parametrize("theme, accent", [("black", "#ffffff"), ("dark", "#fffff"), ("dark", "blue")])
+def test_accent_palette_rejects_invalid_arguments(theme, accent):
+    with pytest.raises(ValueError):
+        qdarktheme.accent_palette(accent, theme)
@@ -0,0 +1,41 @@
+"""Tests of the pre-rendered stylesheet bundle."""
+
+import pytest
+from helpers import VARIANTS
+
+from qdarktheme import _bundle, _style_loader
+
+
+@pytest.fixture(scope="module")
+def bundle():
+    try:
+        return _bundle.Bundle(_bundle.BUNDLE_PATH)
+    except (OSError, ValueError) as e:
+        pytest.skip("stylesheet bundle is not built: {}".format(e))
+
+
+@pytest.mark.parametrize("with_icons", [False, True])
+@pytest.mark.parametrize("corner_shape", ["rounded", "sharp"])
+@pytest.mark.parametrize("theme, accent", VARIANTS)
+def test_bundle_matches_render(fresh_render, bundle, theme, accent, corner_shape, with_icons):
+    custom_colors_key = _style_loader._canonical_custom_colors(None if accent is None else {"primary": accent})
+    key = _bundle.variant_key(theme, corner_shape, custom_colors_key, with_icons)
+    assert key in bundle
+    assert bundle.get(key) == _style_loader._render_stylesheet(theme, corner_shape, custom_colors_key, with_icons)
+
+
+def test_bundle_misses_other_variants(bundle):
+    key = _bundle.variant_key("dark", "rounded", '{"primary":"#123456"}', False)
+    assert key not in bundle
+    assert bundle.get(key) is None
+
+
+def test_stale_bundle_is_not_used(monkeypatch, bundle):
+    monkeypatch.setattr(_bundle, "sources_hash", lambda: "stale")
+    with pytest.raises(ValueError):
+        _bundle.Bundle(_bundle.BUNDLE_PATH)
+    _bundle.get_bundle.cache_clear()
+    try:
+        assert _bundle.get_bundle() is None
+    finally:
+        _bundle.get_bundle.cache_clear()
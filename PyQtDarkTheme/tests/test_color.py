@@ -0,0 +1,75 @@
+"""Tests of the immutable color values."""
+
+import copy
+import pickle
+import random
+
+import pytest
+
+from qdarktheme._color import _HSLA, _RGBA, Color
+
+_VALUES = [
+    Color.from_hex("#12345678"),
+    Color(_HSLA(200, 0.5, 0.333, 0.5)),
+    _RGBA(1, 2, 3, 0.5),
+    _HSLA(10, 0.2, 0.3),
+]
+
+
+@pytest.mark.parametrize("value", _VALUES, ids=repr)
+def test_immutable(value):
+    with pytest.raises(AttributeError):
+        value._a = 0
+
+
+@pytest.mark.parametrize("value", _VALUES, ids=repr)
+def test_copy_returns_the_same_value(value):
+    assert copy.copy(value) is value
+    assert copy.deepcopy(value) is value
+
+
+@pytest.mark.parametrize("value", _VALUES, ids=repr)
+def test_pickle_round_trip(value):
+    restored = pickle.loads(pickle.dumps(value))
+    assert restored == value
+    assert hash(restored) == hash(value)
+
+
+def test_pickled_color_keeps_its_source_hsla():
+    color = Color(_HSLA(200, 0.5, 0.333, 0.5))
+    restored = pickle.loads(pickle.dumps(color))
+    assert restored.hsla == color.hsla
+    assert restored.lighten(0.2) == color.lighten(0.2)
+
+
+def test_equal_colors_transform_equally():
+    rng = random.Random(0)
+    for _ in range(2000):
+        color = Color(_HSLA(rng.randrange(361), rng.random(), rng.random(), rng.random()))
+        rgba = color.rgba
+        for other in (color, Color.from_rgba(rgba.r, rgba.g, rgba.b, round(rgba.a * 255))):
+            if color == other:
+                assert hash(color) == hash(other)
+                assert color.lighten(0.3) == other.lighten(0.3)
+                assert color.darken(0.3) == other.darken(0.3)
+
+
+def test_colors_as_dict_keys():
+    colors = {Color.from_hex("#ff0000"): "red"}
+    assert colors[Color(_RGBA(255, 0, 0))] == "red"
+    assert Color.from_hex("#ff0000") is Color.from_hex("#ff0000")
+
+
+def test_colors_are_interned():
+    assert Color.from_rgba(18, 52, 86, 255) is Color.from_rgba(18, 52, 86, 255)
+    assert Color.from_hex("#123456") == Color.from_rgba(18, 52, 86, 255)
+
+
+def test_transforms_are_memoized():
+    color = Color.from_hex("#5f9af4")
+    assert color.lighten(0.2) is color.lighten(0.2)
+    assert color.darken(0.2) is Color.from_hex("#5f9af4").darken(0.2)
+    assert color.transparent(0.5) is color.transparent(0.5)
+    hsla = color.hsla
+    assert color.lighten(0.2) == Color(_HSLA(hsla.hue, hsla.sat, hsla.lum + hsla.lum * 0.2, hsla.alpha))
+    assert color.transparent(0.5) == Color(_RGBA(*tuple(color.rgba)[:3], color.rgba.a * 0.5))
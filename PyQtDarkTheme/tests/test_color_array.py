@@ -0,0 +1,85 @@
+"""Tests of the batch color transforms against transforming each Color on its own."""
+
+import random
+
+import pytest
+from helpers import ACCENTS
+
+import qdarktheme
+from qdarktheme import _accent, _color_array
+from qdarktheme._color import _HSLA, _RGBA, Color
+from qdarktheme._color_array import ColorArray
+
+_USE_NUMPY = [False, pytest.param(True, marks=pytest.mark.skipif(_color_array.np is None, reason="no NumPy"))]
+
+
+def _random_colors(count, seed = 0) -> list:
+    rng = random.Random(seed)
+    colors = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            colors.append(Color(_RGBA(rng.randrange(256), rng.randrange(256), rng.randrange(256), rng.random())))
+        else:
+            colors.append(Color(_HSLA(rng.randrange(361), rng.random(), rng.random(), rng.random())))
+    return colors
+
+
+def _formats(colors) -> tuple:
+    return (
+        [tuple(color.rgba) for color in colors],
+        [str(color) for color in colors],
+        [color._to_hex() for color in colors],
+        [color.to_hex_argb() for color in colors],
+    )
+
+
+def _array_formats(color_array) -> tuple:
+    return (color_array.rows(), color_array.to_rgba_strings(), color_array.to_hex(), color_array.to_hex_argb())
+
+
+@pytest.mark.parametrize("use_numpy", _USE_NUMPY)
+@pytest.mark.parametrize("transform", ["lighten", "darken", "transparent"])
+def test_transforms_match_color(use_numpy, transform):
+    colors = _random_colors(1000)
+    factors = [random.Random(1).random() for _ in colors]
+    color_array = ColorArray(colors, use_numpy)
+    assert _array_formats(color_array) == _formats(colors)
+    assert _array_formats(getattr(color_array, transform)(0.3)) == _formats(
+        [getattr(color, transform)(0.3) for color in colors]
+    )
+    assert _array_formats(getattr(color_array, transform)(factors)) == _formats(
+        [getattr(color, transform)(factor) for color, factor in zip(colors, factors)]
+    )
+
+
+@pytest.mark.parametrize("use_numpy", _USE_NUMPY)
+def test_chained_transforms_match_color(use_numpy):
+    colors = _random_colors(1000, seed=2)
+    result = ColorArray(colors, use_numpy).transparent(0.4).darken(0.2).lighten(0.1)
+    assert _array_formats(result) == _formats([color.transparent(0.4).darken(0.2).lighten(0.1) for color in colors])
+
+
+def test_factors_must_match_the_colors():
+    with pytest.raises(ValueError):
+        ColorArray(_random_colors(3), use_numpy=False).lighten([0.1, 0.2])
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_accent_palettes_match_accent_palette(monkeypatch, use_numpy):
+    if use_numpy and _color_array.np is None:
+        pytest.skip("no NumPy")
+    monkeypatch.setattr(_accent, "_MIN_BATCH", 0)
+    if not use_numpy:
+        monkeypatch.setattr(_color_array, "np", None)
+    rng = random.Random(3)
+    for theme in ("dark", "light"):
+        accents = [accent for accent_theme, accent in ACCENTS if accent_theme == theme]
+        accents += ["#{:06x}".format(rng.randrange(1 << 24)) for _ in range(200)] + ["#12345680", "#fff"]
+        assert qdarktheme.accent_palettes(accents, theme) == [
+            qdarktheme.accent_palette(accent, theme) for accent in accents
+        ]
+
+
+def test_accent_palettes_rejects_invalid_theme():
+    with pytest.raises(ValueError):
+        qdarktheme.accent_palettes([], "black")
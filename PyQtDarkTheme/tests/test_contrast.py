@@ -0,0 +1,57 @@
+"""Tests of the contrast audit of the resolved theme colors."""
+
+import pytest
+
+import qdarktheme
+from qdarktheme import _resources
+from qdarktheme._color import Color
+from qdarktheme._contrast import contrast_ratio, template_color_pairs
+
+
+def test_contrast_ratio():
+    black, white = Color.from_hex("#000000"), Color.from_hex("#ffffff")
+    assert contrast_ratio(black, white) == pytest.approx(21)
+    assert contrast_ratio(white, black) == pytest.approx(21)
+    assert contrast_ratio(white, white) == pytest.approx(1)
+    # Half transparent black on white is gray.
+    assert contrast_ratio(Color.from_hex("#00000080"), white) == pytest.approx(
+        contrast_ratio(Color.from_hex("#7f7f7f"), white), rel=0.01
+    )
+    # A transparent background shows the backdrop.
+    assert contrast_ratio(white, Color.from_hex("#ffffff00"), black) == pytest.approx(21)
+
+
+def test_template_color_pairs_inherit_undeclared_sides():
+    pairs = template_color_pairs(
+        "QWidget {background:{{background|color}};color:{{foreground|color}}}"
+        "QPushButton {color:{{primary|color}}}"
+        "QPushButton:hover {background:{{primary|color(state=\"button.hoverBackground\")}}}"
+        "QScrollBar::handle {background:{{border|color}}}"
+    )
+    assert pairs == (
+        ("QWidget", "color", "foreground", "background"),
+        ("QPushButton", "color", "primary", "background"),
+        ("QPushButton:hover", "color", "primary", "primary:button.hoverBackground"),
+    )
+
+
+@pytest.mark.parametrize("theme", ["dark", "light"])
+def test_audit_contrast(theme):
+    pairs = template_color_pairs(_resources.stylesheets.TEMPLATE_STYLESHEET)
+    table = qdarktheme.load_color_table(theme)
+    assert all(foreground in table and background in table for _, _, foreground, background in pairs)
+
+    assert qdarktheme.audit_contrast(theme, min_ratio=1) == []
+    issues = qdarktheme.audit_contrast(theme, min_ratio=22)
+    enabled = [pair for pair in pairs if ":disabled" not in pair[0]]
+    assert [(issue.selector, issue.property, issue.foreground, issue.background) for issue in issues] == enabled
+    assert len(qdarktheme.audit_contrast(theme, min_ratio=22, include_disabled=True)) == len(pairs) > len(enabled)
+
+    for issue in qdarktheme.audit_contrast(theme):
+        assert issue.ratio < 4.5
+
+
+def test_audit_contrast_finds_an_unreadable_accent():
+    issues = qdarktheme.audit_contrast("light", {"primary": "#ffeb3b"}, min_ratio=1.5)
+    assert any(issue.foreground == "primary" for issue in issues)
+    assert not any(issue.foreground == "primary" for issue in qdarktheme.audit_contrast("light", min_ratio=1.5))
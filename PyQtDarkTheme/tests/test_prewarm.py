@@ -0,0 +1,83 @@
+"""Tests of the pre-rendering of the likely next stylesheets."""
+
+import threading
+
+from qdarktheme._prewarm import Prewarmer
+
+ACCENTS = {"dark": {"blue": "#8ab4f7", "green": "#83e281", "red": "#f28b82"}, "light": ["#1a73e8", "#188038"]}
+
+
+def _join_workers() -> None:
+    for thread in threading.enumerate():
+        if thread.name == "qdarktheme-prewarm":
+            thread.join(5)
+
+
+def test_neighbours():
+    prewarmer = Prewarmer(None, ACCENTS)
+    assert prewarmer.neighbours("dark", "rounded", {"primary": "#83E281"}, False) == [
+        ("light", "rounded", {"primary": "#188038"}, False),
+        ("dark", "sharp", {"primary": "#83E281"}, False),
+        ("dark", "rounded", {"primary": "#8ab4f7"}, False),
+        ("dark", "rounded", {"primary": "#f28b82"}, False),
+    ]
+    # The light theme has no third accent, and the first accent has no previous one.
+    assert prewarmer.neighbours("dark", "sharp", {"primary": "#f28b82"}, True)[0] == (
+        "light",
+        "sharp",
+        {"primary": "#f28b82"},
+        True,
+    )
+    assert prewarmer.neighbours("light", "sharp", {"primary": "#1a73e8"}, True)[2:] == [
+        ("light", "sharp", {"primary": "#188038"}, True)
+    ]
+    # Colors other than a listed accent only switch theme and corner shape.
+    assert prewarmer.neighbours("light", "rounded", {"primary": "#123456", "border": "#000"}, False) == [
+        ("dark", "rounded", {"primary": "#123456", "border": "#000"}, False),
+        ("light", "sharp", {"primary": "#123456", "border": "#000"}, False),
+    ]
+
+
+def test_schedule_renders_neighbours():
+    rendered = []
+    prewarmer = Prewarmer(lambda *variant: rendered.append(variant), ACCENTS, delay=0)
+    custom_colors = {"primary": "#8ab4f7"}
+    prewarmer.schedule("dark", "rounded", custom_colors, False)
+    custom_colors["primary"] = "#000000"
+    _join_workers()
+    assert rendered == prewarmer.neighbours("dark", "rounded", {"primary": "#8ab4f7"}, False)
+
+    # The same variant again is already pre-rendered.
+    prewarmer.schedule("dark", "rounded", {"primary": "#8ab4f7"}, False)
+    _join_workers()
+    assert len(rendered) == 3
+
+
+def test_cancel_stops_pending_variants():
+    started, release = threading.Event(), threading.Event()
+    rendered = []
+
+    def render(*variant):
+        rendered.append(variant)
+        started.set()
+        release.wait(5)
+
+    prewarmer = Prewarmer(render, ACCENTS, delay=0.01)
+    prewarmer.schedule("dark", "rounded", {"primary": "#83e281"}, False)
+    assert started.wait(5)
+    prewarmer.cancel()
+    release.set()
+    _join_workers()
+    assert rendered == [("light", "rounded", {"primary": "#188038"}, False)]
+
+
+def test_render_errors_are_ignored():
+    rendered = []
+
+    def render(*variant):
+        rendered.append(variant)
+        raise ValueError(variant)
+
+    Prewarmer(render, delay=0).schedule("dark", "rounded", None, False)
+    _join_workers()
+    assert rendered == [("light", "rounded", None, False), ("dark", "sharp", None, False)]
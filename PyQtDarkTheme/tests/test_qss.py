@@ -0,0 +1,81 @@
+"""Tests of the rule-level handling of rendered stylesheets."""
+
+import qdarktheme
+from qdarktheme._qss import OptimizedStylesheet, RuleDiff, format_rules, parse_rules
+
+
+def test_parse_and_format_rules():
+    stylesheet = "QWidget {color:red}QPushButton:hover {}QLabel, QFrame {border:none;padding:0}"
+    rules = parse_rules(stylesheet)
+    assert rules == [("QWidget", "color:red"), ("QPushButton:hover", ""), ("QLabel, QFrame", "border:none;padding:0")]
+    assert format_rules(rules) == stylesheet
+
+
+def test_rule_diff():
+    old = "QWidget {color:red}QLabel {color:blue}QLabel {padding:0}QFrame {border:none}"
+    new = "QWidget {color:red}QLabel {color:green}QLabel {padding:0}QSlider {height:4px}"
+    diff = RuleDiff(old, new)
+    assert diff
+    assert diff.changed == [("QLabel", "color:blue", "color:green")]
+    assert diff.added == [("QSlider", "height:4px")]
+    assert diff.removed == [("QFrame", "border:none")]
+    assert diff.stylesheet() == "QLabel {color:green}QSlider {height:4px}"
+    assert diff.metrics() == {
+        "old_rules": 4,
+        "new_rules": 4,
+        "changed": 1,
+        "added": 1,
+        "removed": 1,
+        "unchanged": 2,
+        "changed_ratio": 0.75,
+    }
+    assert not RuleDiff(old, old)
+
+
+def test_diff_stylesheets_of_an_accent_change(fresh_render):
+    accent = {"theme": "dark", "custom_colors": {"primary": "#123456"}}
+    diff = qdarktheme.diff_stylesheets({"theme": "dark"}, accent)
+    assert diff.changed and not diff.added and not diff.removed
+    new_rules = parse_rules(qdarktheme.load_stylesheet(**accent))
+    assert all((selector, body) in new_rules for selector, _, body in diff.changed)
+    assert diff.metrics()["unchanged"] > diff.metrics()["changed"]
+    assert not qdarktheme.diff_stylesheets(accent, qdarktheme.load_stylesheet(**accent))
+
+
+def test_optimized_stylesheet():
+    stylesheet = (
+        "A {color:red;color:blue}B {}C:hover {}D {color:blue}E {border:none}F, A {color:blue}"
+        "G {}H {border-top:1px}I {border:none}"
+    )
+    optimized = OptimizedStylesheet(stylesheet, keep_empty=["B"])
+    assert parse_rules(optimized.stylesheet) == [
+        ("A,D,F", "color:blue"),
+        ("B", ""),
+        ("C:hover", ""),
+        ("E", "border:none"),
+        ("H", "border-top:1px"),
+        # Merged into E, the rule would move before the border-top of H.
+        ("I", "border:none"),
+    ]
+    assert optimized.metrics() == {
+        "old_bytes": len(stylesheet),
+        "new_bytes": len(optimized.stylesheet),
+        "saved_bytes": len(stylesheet) - len(optimized.stylesheet),
+        "old_rules": 9,
+        "new_rules": 6,
+        "empty_rules": 1,
+        "merged_rules": 2,
+        "shadowed_declarations": 1,
+    }
+
+
+def test_optimize_stylesheet_of_the_themes(fresh_render):
+    for theme in ("dark", "light"):
+        stylesheet = qdarktheme.load_stylesheet(theme)
+        optimized = qdarktheme.load_stylesheet(theme, optimize=True)
+        assert optimized == qdarktheme.optimize_stylesheet(stylesheet).stylesheet
+        assert len(optimized) < len(stylesheet)
+        # Written empty in the template, so that Qt repaints the handle on hover.
+        assert "QSplitterHandle::item:hover {}" in optimized
+        metrics = qdarktheme.optimize_stylesheet(stylesheet).metrics()
+        assert metrics["old_rules"] - metrics["new_rules"] == metrics["empty_rules"] + metrics["merged_rules"]
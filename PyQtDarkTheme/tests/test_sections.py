@@ -0,0 +1,73 @@
+"""Tests of the stylesheet sections of the used widget classes."""
+
+import pytest
+from helpers import THEMES
+
+import qdarktheme
+from qdarktheme import _resources, _sections
+from qdarktheme._qss import parse_rules
+
+TEXT = (
+    "QWidget {color:{{foreground|color}}}"
+    "QStatusBar QWidget, QToolButton:hover {border:none}"
+    'QMenu::item[selected="true"] {padding:{{corner-shape|env(value="{0}")}}}'
+    "QComboBox QAbstractItemView {}"
+)
+
+
+def test_selector_classes():
+    rules = _sections.split_rules(TEXT)
+    assert [rule.selectors for rule in rules] == [
+        (("QWidget", frozenset(["QWidget"])),),
+        (
+            ("QStatusBar QWidget", frozenset(["QStatusBar", "QWidget"])),
+            ("QToolButton:hover", frozenset(["QToolButton"])),
+        ),
+        (('QMenu::item[selected="true"]', frozenset(["QMenu"])),),
+        (("QComboBox QAbstractItemView", frozenset(["QComboBox", "QAbstractItemView"])),),
+    ]
+    assert _sections.empty_rule_selectors(TEXT) == frozenset(["QComboBox QAbstractItemView"])
+
+
+def test_section_text_keeps_the_matching_selectors():
+    assert _sections.section_text(TEXT, _sections.template_classes(TEXT)) == TEXT
+    assert _sections.section_text(TEXT, frozenset(["QWidget", "QToolButton"])) == (
+        "QWidget {color:{{foreground|color}}}QToolButton:hover {border:none}"
+    )
+    assert _sections.section_text(TEXT, frozenset(["QStatusBar"])) == ""
+
+
+def test_expand_widget_classes_adds_popups():
+    classes = _sections.expand_widget_classes(["QComboBox", "MyWidget"])
+    assert {"QComboBox", "MyWidget", "QListView", "QAbstractItemView", "QWidget", "QMenu"} <= classes
+    assert "QCalendarWidget" not in classes
+
+
+@pytest.mark.parametrize("theme", THEMES)
+def test_reduced_stylesheet_keeps_template_order(fresh_render, theme):
+    full = parse_rules(qdarktheme.load_stylesheet(theme))
+    reduced = parse_rules(qdarktheme.load_stylesheet(theme, widget_classes=["QPushButton"]))
+    assert len(reduced) < len(full)
+    # Each reduced rule is a full rule with some of its selectors, in the same order.
+    remaining = iter(full)
+    for selector, body in reduced:
+        assert any(
+            body == full_body and set(selector.split(",")) <= set(full_selector.split(","))
+            for full_selector, full_body in remaining
+        ), selector
+    selectors = {selector for rule_selectors, _ in reduced for selector in rule_selectors.split(",")}
+    assert "QPushButton:default" in selectors
+    assert any(selector.startswith("QMenu") for selector in selectors)
+    assert not any(selector.startswith("QComboBox") for selector in selectors)
+
+
+def test_reduced_stylesheet_styles_lazy_popups(fresh_render):
+    reduced = qdarktheme.load_stylesheet(widget_classes=["QComboBox"])
+    selectors = {selector for rule_selectors, _ in parse_rules(reduced) for selector in rule_selectors.split(",")}
+    assert any(selector.startswith("QComboBox") for selector in selectors)
+    assert any("QAbstractItemView" in selector for selector in selectors)
+
+
+def test_all_template_classes_give_the_whole_stylesheet(fresh_render):
+    classes = _sections.template_classes(_resources.stylesheets.TEMPLATE_STYLESHEET)
+    assert qdarktheme.load_stylesheet(widget_classes=sorted(classes)) is qdarktheme.load_stylesheet()
@@ -0,0 +1,100 @@
+"""Tests of the stylesheet loader."""
+
+import io
+
+import pytest
+from helpers import VARIANTS
+
+import qdarktheme
+from qdarktheme.qtpy.qt_compat import QT_API
+
+
+@pytest.mark.parametrize("corner_shape", ["rounded", "sharp"])
+@pytest.mark.parametrize("theme, accent", VARIANTS)
+def test_iter_stylesheet_matches_load_stylesheet(fresh_render, theme, accent, corner_shape):
+    custom_colors = None if accent is None else {"primary": accent}
+    expected = qdarktheme.load_stylesheet(theme, corner_shape, custom_colors)
+    chunks = list(qdarktheme.iter_stylesheet(theme, corner_shape, custom_colors))
+    assert len(chunks) > 1
+    assert "".join(chunks) == expected
+
+
+def test_write_stylesheet_matches_load_stylesheet(fresh_render):
+    fp = io.StringIO()
+    qdarktheme.write_stylesheet(fp, "light", "sharp", {"primary": "#123456"}, widget_classes=["QPushButton"])
+    assert fp.getvalue() == qdarktheme.load_stylesheet(
+        "light", "sharp", {"primary": "#123456"}, widget_classes=["QPushButton"]
+    )
+
+
+def test_iter_stylesheet_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        qdarktheme.iter_stylesheet(corner_shape="round")
+
+
+def test_load_stylesheet_memoizes_equivalent_arguments(fresh_render):
+    stylesheet = qdarktheme.load_stylesheet("dark", custom_colors={"primary": "#123456", "border": "#654321"})
+    assert qdarktheme.load_stylesheet(custom_colors={"border": "#654321", "primary": "#123456"}) is stylesheet
+
+
+def test_clear_cache_renders_again(fresh_render):
+    stylesheet = qdarktheme.load_stylesheet("light", custom_colors={"primary": "#123456"})
+    qdarktheme.clear_cache()
+    rendered = qdarktheme.load_stylesheet("light", custom_colors={"primary": "#123456"})
+    assert rendered == stylesheet
+    assert rendered is not stylesheet
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"theme": "blue"}, ValueError),
+        ({"corner_shape": "round"}, ValueError),
+        ({"custom_colors": {"primary>unknown": "#ffffff"}}, KeyError),
+        ({"custom_colors": {"primary": "#fffff"}}, ValueError),
+        ({"widget_classes": "QPushButton"}, ValueError),
+    ],
+    ids=["theme", "corner_shape", "color_id", "hex", "widget_classes"],
+)
+def test_load_stylesheet_rejects_invalid_arguments(fresh_render, kwargs, error):
+    with pytest.raises(error):
+        qdarktheme.load_stylesheet(**kwargs)
+
+
+def test_load_stylesheet_async_matches_load_stylesheet(fresh_render):
+    custom_colors = {"primary": "#123456"}
+    future = qdarktheme.load_stylesheet_async("light", "sharp", custom_colors)
+    custom_colors["primary"] = "#654321"
+    assert future.result(timeout=10) == qdarktheme.load_stylesheet("light", "sharp", {"primary": "#123456"})
+    assert qdarktheme.load_stylesheet_async("light", "sharp", {"primary": "#123456"}).result(timeout=10) is (
+        qdarktheme.load_stylesheet("light", "sharp", {"primary": "#123456"})
+    )
+
+
+def test_load_stylesheet_async_raises_from_the_future(fresh_render):
+    future = qdarktheme.load_stylesheet_async(corner_shape="round")
+    with pytest.raises(ValueError):
+        future.result(timeout=10)
+
+
+@pytest.mark.skipif(QT_API is None, reason="Qt binding is not installed")
+def test_set_stylesheet_async_sets_only_the_latest(fresh_render):
+    from qdarktheme.qtpy.QtCore import QCoreApplication, QElapsedTimer
+    from qdarktheme.qtpy.QtWidgets import QApplication, QWidget
+
+    app = QApplication.instance() or QApplication([])
+    widget = QWidget()
+    delivered = []
+    first = qdarktheme.set_stylesheet_async(widget, "dark", callback=delivered.append)
+    second = qdarktheme.set_stylesheet_async(widget, "light", callback=delivered.append)
+    first.result(timeout=10)
+    second.result(timeout=10)
+    timer = QElapsedTimer()
+    timer.start()
+    while not delivered and timer.elapsed() < 10000:
+        QCoreApplication.processEvents()
+    # A stale delivery queued after the latest one must not be set either.
+    QCoreApplication.processEvents()
+    assert delivered == [qdarktheme.load_stylesheet("light")]
+    assert widget.styleSheet() == delivered[0]
+    assert app is QApplication.instance()
@@ -0,0 +1,99 @@
+"""Tests of the stylesheets cached on disk across processes."""
+
+import os
+from concurrent.futures import Future
+
+import pytest
+
+import qdarktheme
+from qdarktheme import _bundle, _style_loader, _stylesheet_cache
+
+_CUSTOM_COLORS = {"primary": "#123456"}
+
+
+class _ImmediateExecutor:
+    """Executor running the submitted function on the calling thread."""
+
+    def submit(self, func, *args):
+        future = Future()
+        future.set_result(func(*args))
+        return future
+
+
+@pytest.fixture()
+def disk_cache(monkeypatch, tmp_path):
+    """Write the disk cache to an empty directory, without the bundle and worker threads."""
+    monkeypatch.setattr(_stylesheet_cache, "get_cash_root_path", lambda version: tmp_path)
+    monkeypatch.setattr(_bundle, "get_bundle", lambda: None)
+    monkeypatch.setattr(_style_loader, "_get_executor", _ImmediateExecutor)
+    qdarktheme.clear_cache()
+    yield tmp_path
+    qdarktheme.clear_cache()
+
+
+def _cached_files(root) -> list:
+    return sorted(path.name for path in root.glob("stylesheet_*.qss"))
+
+
+def test_dump_and_load(disk_cache):
+    _stylesheet_cache.dump_stylesheet("abc", "QWidget {color:red}")
+    assert _stylesheet_cache.load_stylesheet("abc") == "QWidget {color:red}"
+    assert _stylesheet_cache.load_stylesheet("abd") is None
+    assert not list(disk_cache.glob("*.tmp"))
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: data.replace("red", "blue"),
+        lambda data: data.replace("abc", "abd", 1),
+        lambda data: data.split("\n", 1)[1],
+        lambda data: data[:-3],
+    ],
+    ids=["body", "key", "header", "truncated"],
+)
+def test_load_rejects_broken_files(disk_cache, corrupt):
+    _stylesheet_cache.dump_stylesheet("abc", "QWidget {color:red}")
+    path = disk_cache / "stylesheet_abc.qss"
+    path.write_text(corrupt(path.read_text(encoding="utf-8")), encoding="utf-8")
+    assert _stylesheet_cache.load_stylesheet("abc") is None
+
+
+def test_load_rejects_missing_svg_files(disk_cache):
+    svg = disk_cache / "check.svg"
+    svg.write_text("<svg/>")
+    _stylesheet_cache.dump_stylesheet("abc", "QCheckBox::indicator {{image:url({})}}".format(svg.as_posix()))
+    assert _stylesheet_cache.load_stylesheet("abc") is not None
+    svg.unlink()
+    assert _stylesheet_cache.load_stylesheet("abc") is None
+
+
+def test_prune_keeps_the_most_recently_used(disk_cache, monkeypatch):
+    monkeypatch.setattr(_stylesheet_cache, "MAX_STYLESHEETS", 3)
+    for index in range(3):
+        _stylesheet_cache.dump_stylesheet(str(index), "QWidget {}")
+        os.utime(str(disk_cache / "stylesheet_{}.qss".format(index)), (index, index))
+    assert _stylesheet_cache.load_stylesheet("0") is not None  # Marks 0 as the most recent.
+    _stylesheet_cache.dump_stylesheet("3", "QWidget {}")
+    assert _cached_files(disk_cache) == ["stylesheet_0.qss", "stylesheet_2.qss", "stylesheet_3.qss"]
+
+
+def test_load_stylesheet_writes_on_first_render(disk_cache, monkeypatch):
+    stylesheet = qdarktheme.load_stylesheet(custom_colors=_CUSTOM_COLORS)
+    assert len(_cached_files(disk_cache)) == 1
+
+    # A new process reads the stylesheet from disk instead of rendering it.
+    qdarktheme.clear_cache()
+    monkeypatch.setattr(_style_loader, "_stylesheet_template", None)
+    assert qdarktheme.load_stylesheet(custom_colors=_CUSTOM_COLORS) == stylesheet
+
+
+def test_previews_are_not_written(disk_cache):
+    qdarktheme.load_stylesheet(custom_colors=_CUSTOM_COLORS, persist=False)
+    qdarktheme.diff_stylesheets({"theme": "light"}, {"theme": "light", "custom_colors": _CUSTOM_COLORS})
+    _style_loader._prewarm_render("dark", "sharp", _CUSTOM_COLORS, False)
+    assert _cached_files(disk_cache) == []
+
+    # Loading a pre-rendered stylesheet writes it.
+    qdarktheme.load_stylesheet(corner_shape="sharp", custom_colors=_CUSTOM_COLORS)
+    assert len(_cached_files(disk_cache)) == 1
@@ -0,0 +1,114 @@
+"""Tests of the template engine against rendering each stylesheet from scratch."""
+
+import pytest
+from helpers import ACCENTS, THEMES, VARIANTS, replacements
+
+from qdarktheme import _resources
+from qdarktheme._style_loader import _STYLESHEET_FILTERS
+from qdarktheme._template import codegen
+from qdarktheme._template.codegen import CodeTemplate
+from qdarktheme._template.engine import Template, _CompiledTemplate, _TemplateCache
+
+_TEMPLATES = [
+    _resources.stylesheets.TEMPLATE_STYLESHEET,
+    _resources.stylesheets.TEMPLATE_STANDARD_ICONS_STYLESHEET,
+]
+_PLANS = [_resources.plans.TEMPLATE_STYLESHEET_PLAN, _resources.plans.TEMPLATE_STANDARD_ICONS_STYLESHEET_PLAN]
+
+
+@pytest.mark.parametrize("text", _TEMPLATES, ids=["stylesheet", "standard_icons"])
+def test_render_incremental_matches_render(text):
+    template = Template(text, _STYLESHEET_FILTERS)
+    variants = [(theme, None, "rounded") for theme in THEMES]
+    variants += [(theme, accent, "rounded") for theme, accent in ACCENTS]
+    variants += [("dark", None, "sharp"), ("dark", None, "rounded")]
+    # Render back and forth, so that each render starts from the state of the previous variant.
+    for theme, accent, corner_shape in variants + variants[::-1]:
+        values = replacements(theme, accent, corner_shape)
+        assert template.render_incremental(values) == Template(text, _STYLESHEET_FILTERS).render(values)
+
+
+def test_render_incremental_only_recomputes_changed_placeholders(monkeypatch):
+    template = Template(_resources.stylesheets.TEMPLATE_STYLESHEET, _STYLESHEET_FILTERS)
+    template.render_incremental(replacements("dark", None))
+    rendered = []
+    render_placeholder = template._render_placeholder
+
+    def spy(placeholder, *args):
+        rendered.append(placeholder)
+        return render_placeholder(placeholder, *args)
+
+    monkeypatch.setattr(template, "_render_placeholder", spy)
+    template.render_incremental(replacements("dark", None, "sharp"))
+    assert rendered
+    assert all(placeholder.dependencies == {"corner-shape"} for placeholder in rendered)
+
+
+def test_template_cache_counts_hits_and_misses():
+    cache = _TemplateCache(maxsize=2)
+    filters = {"color": _STYLESHEET_FILTERS["color"]}
+    first = cache.get("a{{x|color}}", filters)
+    assert cache.get("a{{x|color}}", dict(filters)) is first
+    assert cache.info() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 2}
+
+    cache.get("b{{x|color}}", filters)
+    cache.get("a{{x|color}}", filters)  # a is now the most recently used.
+    cache.get("c{{x|color}}", filters)  # Evicts b.
+    assert cache.get("a{{x|color}}", filters) is first
+    cache.get("b{{x|color}}", filters)
+    assert cache.info() == {"hits": 3, "misses": 4, "size": 2, "maxsize": 2}
+
+    cache.clear()
+    assert cache.info() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 2}
+
+
+def test_template_cache_keys_by_filters():
+    cache = _TemplateCache(maxsize=2)
+    template = cache.get("a{{x|color}}", {"color": _STYLESHEET_FILTERS["color"]})
+    assert cache.get("a{{x|color}}", {"color": _STYLESHEET_FILTERS["corner"]}) is not template
+    assert cache.info()["misses"] == 2
+
+
+@pytest.mark.parametrize("text, plan", list(zip(_TEMPLATES, _PLANS)), ids=["stylesheet", "standard_icons"])
+def test_shipped_plans_match_the_templates(text, plan):
+    assert plan == _CompiledTemplate.parse(text)
+
+
+def test_stale_plan_is_ignored():
+    text = _resources.stylesheets.TEMPLATE_STANDARD_ICONS_STYLESHEET
+    values = replacements("dark", None)
+    template = Template(text + "QWidget {color:{{foreground|color}}}", _STYLESHEET_FILTERS, _PLANS[1])
+    assert template.render(values).endswith("QWidget {color:rgba(228, 231, 235, 1.000)}")
+
+
+@pytest.mark.parametrize("text, plan", list(zip(_TEMPLATES, _PLANS)), ids=["stylesheet", "standard_icons"])
+def test_code_template_matches_template(text, plan):
+    template = CodeTemplate(text, _STYLESHEET_FILTERS, plan)
+    for theme, accent in VARIANTS:
+        values = replacements(theme, accent)
+        expected = Template(text, _STYLESHEET_FILTERS).render(values)
+        assert template.render(values) == expected
+        assert "".join(template.render_iter(values)) == expected
+
+
+def test_code_template_loads_the_code_cached_on_disk(monkeypatch):
+    text = "QWidget {color:{{foreground|color}};border-radius:{{corner-shape|corner(size=4)}}px}"
+    CodeTemplate(text, _STYLESHEET_FILTERS)
+    assert codegen._cache_path(text).exists()
+
+    def generate_source(compiled):
+        raise AssertionError("the cached code was not used")
+
+    monkeypatch.setattr(codegen, "_generate_source", generate_source)
+    values = replacements("light", None, "sharp")
+    assert CodeTemplate(text, _STYLESHEET_FILTERS).render(values) == Template(text, _STYLESHEET_FILTERS).render(values)
+
+
+def test_code_template_regenerates_broken_code():
+    text = "QWidget {color:{{foreground|color}}}"
+    CodeTemplate(text, _STYLESHEET_FILTERS)
+    path = codegen._cache_path(text)
+    path.write_bytes(path.read_bytes()[:20])
+    values = replacements("dark", None)
+    assert CodeTemplate(text, _STYLESHEET_FILTERS).render(values) == Template(text, _STYLESHEET_FILTERS).render(values)
+    assert codegen._load_code(path) is not None
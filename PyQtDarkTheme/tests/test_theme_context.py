@@ -0,0 +1,56 @@
+"""Tests of the long-lived state of a base theme."""
+
+import copy
+import json
+
+import pytest
+
+import qdarktheme
+from qdarktheme import _resources
+from qdarktheme._theme_context import ThemeContext
+
+
+def test_values_are_parsed_from_the_theme():
+    context = ThemeContext("dark")
+    assert context.values == json.loads(_resources.colors.THEME_COLOR_VALUES["dark"])
+    with pytest.raises(ValueError):
+        ThemeContext("blue")
+
+
+def test_overlay_copies_only_changed_colors():
+    context = ThemeContext("light")
+    base = copy.deepcopy(context.values)
+    values = context.overlay({"primary": "#123456", "[light]": {"linkVisited": "#654321"}, "[dark]": {"linkVisited": "#000"}})
+    assert values["primary"]["base"] == "#123456"
+    assert values["linkVisited"] == "#654321"
+    assert values["primary"] is not context.values["primary"]
+    assert values["background"] is context.values["background"]
+    assert context.values == base
+
+
+@pytest.mark.parametrize(
+    "custom_colors, error",
+    [
+        ({"[dark]": "#ffffff"}, ValueError),
+        ({"primary>unknown": "#ffffff"}, KeyError),
+        ({"linkVisited>base": "#ffffff"}, KeyError),
+        ({"primary": "#123456", "unknown": "#ffffff"}, KeyError),
+    ],
+    ids=["theme_section", "child_id", "child_of_str", "after_valid_id"],
+)
+def test_invalid_custom_colors_leave_the_base_unchanged(custom_colors, error):
+    context = ThemeContext("dark")
+    base = copy.deepcopy(context.values)
+    with pytest.raises(error):
+        context.overlay(custom_colors)
+    assert context.values == base
+
+
+def test_color_tables_share_the_base(fresh_render):
+    context = qdarktheme._theme_context.get_theme_context("dark")
+    key = '{"primary":"#123456"}'
+    table = context.get_color_table(key)
+    assert context.get_color_table(key) is table
+    assert context.get_color_table("null") is context.color_table
+    assert table["background"] is context.color_table["background"]
+    assert table["primary"] != context.color_table["primary"]
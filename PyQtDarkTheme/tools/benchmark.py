@@ -0,0 +1,264 @@
+"""Benchmark the qdarktheme rendering pipeline stage by stage.
+
+Every combination of theme, corner shape, accent of ``common.ACCENT_COLORS`` and with or without
+the standard icons stylesheet is timed. The stages of the pipeline are fed the same color table
+replacements as the loader, and ``load_cold``/``load_warm`` time ``load_stylesheet`` itself: cold
+with the in-process caches cleared and the bundle and disk cache disabled, warm as called
+again. The total time of each stage over all combinations is compared with the stored
+baseline, and the script exits with status 1 when a stage is slower than
+``baseline * threshold`` by more than ``--min-delta`` milliseconds, so that the noise of stages
+taking microseconds cannot fail it::
+
+    python tools/benchmark.py                 # compare with tools/benchmark_baseline.json
+    python tools/benchmark.py --save          # store the current timings as the baselines
+    python tools/benchmark.py --threshold 1.2 --min-delta 2
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, _ROOT)
+
+import common  # noqa: E402
+from qdarktheme import _bundle, _resources, _style_loader, _stylesheet_cache  # noqa: E402
+from qdarktheme._color_table import ColorTable  # noqa: E402
+from qdarktheme._style_loader import _STYLESHEET_FILTERS, _canonical_custom_colors  # noqa: E402
+from qdarktheme._template import codegen, filter  # noqa: E402
+from qdarktheme._template.engine import _FILTER_MEMO, Template, _CompiledTemplate  # noqa: E402
+from qdarktheme._theme_context import ThemeContext  # noqa: E402
+from qdarktheme._util import multi_replace  # noqa: E402
+
+_BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+_STAGES = (
+    "color_values",
+    "marge_colors",
+    "parse",
+    "compile",
+    "filters",
+    "url",
+    "assemble",
+    "multi_replace",
+    "render",
+    "load_cold",
+    "load_warm",
+)
+
+
+def _best(func, setup=None, repeat=5) -> float:
+    """Return the best time of ``repeat`` runs of ``func``, calling ``setup`` before each run."""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _sections(icons):
+    sections = [(_resources.stylesheets.TEMPLATE_STYLESHEET, _resources.plans.TEMPLATE_STYLESHEET_PLAN)]
+    if icons:
+        sections.append(
+            (
+                _resources.stylesheets.TEMPLATE_STANDARD_ICONS_STYLESHEET,
+                _resources.plans.TEMPLATE_STANDARD_ICONS_STYLESHEET_PLAN,
+            )
+        )
+    return sections
+
+
+def _split_url(filter_calls):
+    """Split a filter chain before its url filter."""
+    for index, filter_call in enumerate(filter_calls):
+        if filter_call.name == "url":
+            return filter_calls[:index], filter_calls[index:]
+    return filter_calls, ()
+
+
+def _evaluate(placeholder, replacements, filter_calls):
+    value = placeholder.value
+    if type(value) is str and len(value) != 0:
+        value = replacements[value]
+    for filter_call in filter_calls:
+        value = filter_call(value)
+    return value
+
+
+def _bench_combination(theme, corner_shape, accent, icons, cache_dir) -> dict:
+    results = {}
+    custom_colors = {"primary": accent}
+    # The theme context is built once per process and overlays do not mutate it.
+    results["color_values"] = _best(lambda: ThemeContext(theme))
+    context = ThemeContext(theme)
+    results["marge_colors"] = _best(
+        lambda: ColorTable(context.overlay(custom_colors), base=context.color_table)
+    )
+    color_table = context.get_color_table(_canonical_custom_colors(custom_colors))
+    replacements = dict(color_table.replacements, **{"corner-shape": corner_shape})
+
+    sections = _sections(icons)
+    compiled = [_CompiledTemplate(text, _STYLESHEET_FILTERS, plan) for text, plan in sections]
+    results["parse"] = _best(lambda: [_CompiledTemplate.parse(text) for text, _ in sections])
+    results["compile"] = _best(
+        lambda: [_CompiledTemplate(text, _STYLESHEET_FILTERS, plan) for text, plan in sections]
+    )
+
+    chains = [
+        [(placeholder, _split_url(placeholder.filters)) for placeholder in template.placeholders]
+        for template in compiled
+    ]
+    results["filters"] = _best(
+        lambda: [
+            [_evaluate(placeholder, replacements, head) for placeholder, (head, _) in chain]
+            for chain in chains
+        ]
+    )
+    inputs = [
+        [(_evaluate(placeholder, replacements, head), tail) for placeholder, (head, tail) in chain]
+        for chain in chains
+    ]
+
+    def write_urls():
+        for chain in inputs:
+            for value, tail in chain:
+                for filter_call in tail:
+                    value = filter_call(value)
+
+    def clear_cache_dir():
+        shutil.rmtree(str(cache_dir), ignore_errors=True)
+        cache_dir.mkdir(parents=True)
+
+    results["url"] = _best(write_urls, clear_cache_dir)
+
+    values = [
+        [str(_evaluate(placeholder, replacements, placeholder.filters)) for placeholder in template.placeholders]
+        for template in compiled
+    ]
+    results["assemble"] = _best(
+        lambda: "".join("".join(template.fill(v)) for template, v in zip(compiled, values))
+    )
+    match_replacements = [
+        ({p.match_text: v for p, v in zip(template.placeholders, section_values)}, text)
+        for template, section_values, (text, _) in zip(compiled, values, sections)
+    ]
+    results["multi_replace"] = _best(
+        lambda: [multi_replace(text, mapping) for mapping, text in match_replacements]
+    )
+    results["render"] = _best(
+        lambda: "".join(
+            Template(text, _STYLESHEET_FILTERS, plan).render(replacements) for text, plan in sections
+        ),
+        _FILTER_MEMO.clear,
+    )
+
+    _style_loader._use_icons_stylesheet = lambda: icons
+    load = lambda: _style_loader.load_stylesheet(theme, corner_shape, custom_colors)  # noqa: E731
+
+    def clear_caches():
+        _style_loader.clear_cache()
+        _FILTER_MEMO.clear()
+
+    results["load_cold"] = _best(load, clear_caches)
+    results["load_warm"] = _best(load)
+    return results
+
+
+def run() -> dict:
+    """Time every stage for every combination and return ``{combination: {stage: seconds}}``."""
+    cache_dir = Path(tempfile.mkdtemp(prefix="qdarktheme-benchmark-"))
+    modules = (filter, codegen, _style_loader, _stylesheet_cache)
+    get_cash_root_paths = [module.get_cash_root_path for module in modules]
+    for module in modules:
+        module.get_cash_root_path = lambda version: cache_dir
+    patched = {
+        (_bundle, "get_bundle"): lambda: None,
+        (_stylesheet_cache, "load_stylesheet"): lambda key: None,
+        (_stylesheet_cache, "dump_stylesheet"): lambda key, stylesheet: None,
+    }
+    # _use_icons_stylesheet is replaced for each combination.
+    originals = {target: getattr(*target) for target in [*patched, (_style_loader, "_use_icons_stylesheet")]}
+    for (module, name), value in patched.items():
+        setattr(module, name, value)
+    try:
+        results = {}
+        for theme in ("dark", "light"):
+            for corner_shape in ("rounded", "sharp"):
+                for accent_name, accent in common.ACCENT_COLORS[theme].items():
+                    for icons in (False, True):
+                        key = "{}/{}/{}/{}".format(
+                            theme, corner_shape, accent_name, "icons" if icons else "no-icons"
+                        )
+                        results[key] = _bench_combination(theme, corner_shape, accent, icons, cache_dir)
+        return results
+    finally:
+        for module, get_cash_root_path in zip(modules, get_cash_root_paths):
+            module.get_cash_root_path = get_cash_root_path
+        for (module, name), value in originals.items():
+            setattr(module, name, value)
+        _style_loader.clear_cache()
+        shutil.rmtree(str(cache_dir), ignore_errors=True)
+
+
+def _summary(results) -> dict:
+    """Return the total time of each stage over all combinations."""
+    return {stage: sum(timings[stage] for timings in results.values()) for stage in _STAGES}
+
+
+def compare(summary, baselines, threshold, min_delta) -> list:
+    """Return ``(stage, seconds, baseline)`` of the stage totals slower than the threshold.
+
+    A stage only counts as slower if it is also ``min_delta`` seconds slower than its baseline.
+    """
+    regressions = []
+    for stage, seconds in summary.items():
+        baseline = baselines.get(stage)
+        if baseline is not None and seconds > baseline * threshold and seconds - baseline > min_delta:
+            regressions.append((stage, seconds, baseline))
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmark and compare or save the baselines."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--save", action="store_true", help="store the timings as the new baselines")
+    parser.add_argument("--threshold", type=float, default=1.5, help="allowed slowdown ratio")
+    parser.add_argument(
+        "--min-delta", type=float, default=1.0, help="allowed slowdown of a stage total in milliseconds"
+    )
+    parser.add_argument("--baseline", default=_BASELINE_PATH, help="path of the baseline file")
+    args = parser.parse_args()
+
+    results = run()
+    summary = _summary(results)
+    for stage, seconds in summary.items():
+        print("{:<14} {:10.3f} ms".format(stage, seconds * 1000))
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump({"summary": summary, "combinations": results}, f, indent=1, sort_keys=True)
+        print("Saved baselines to {}".format(args.baseline))
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baselines at {}. Run with --save first.".format(args.baseline))
+        return 0
+    with open(args.baseline) as f:
+        baselines = json.load(f)["summary"]
+    regressions = compare(summary, baselines, args.threshold, args.min_delta / 1000)
+    for stage, seconds, baseline in regressions:
+        print(
+            "REGRESSION {}: {:.3f} ms > {:.3f} ms x {}".format(stage, seconds * 1000, baseline * 1000, args.threshold)
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
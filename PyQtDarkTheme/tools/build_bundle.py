@@ -0,0 +1,87 @@
+"""Build ``qdarktheme/_resources/stylesheets.bundle``, the pre-rendered built-in stylesheets.
+
+Every combination of theme, corner shape, accent of ``common.ACCENT_COLORS`` (and no accent) and
+with or without the standard icons stylesheet is rendered. Run this after changing the template
+stylesheets or the theme colors::
+
+    python tools/build_bundle.py
+"""
+
+import json
+import os
+import struct
+import sys
+import zlib
+
+_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, _ROOT)
+
+import common  # noqa: E402
+from qdarktheme import _bundle, _resources  # noqa: E402
+from qdarktheme._style_loader import _STYLESHEET_FILTERS, _canonical_custom_colors, load_color_table  # noqa: E402
+from qdarktheme._template.engine import Template  # noqa: E402
+
+
+def _render(theme, corner_shape, custom_colors, with_icons, svgs) -> str:
+    """Render the stylesheet, leaving the output of the env and url filters as holes."""
+
+    def env(text, **kwargs):
+        return _bundle.HOLE + json.dumps([str(text), kwargs], sort_keys=True) + _bundle.HOLE
+
+    def url(color, id, rotate=0):
+        svg = [id, rotate] + list(color.rgba)
+        if svg not in svgs:
+            svgs.append(svg)
+        return "url({}/{}_{}_{}.svg)".format(_bundle.ROOT, id, color._to_hex(), rotate)
+
+    filters = dict(_STYLESHEET_FILTERS, env=env, url=url)
+    sections = [_resources.stylesheets.TEMPLATE_STYLESHEET]
+    if with_icons:
+        sections.append(_resources.stylesheets.TEMPLATE_STANDARD_ICONS_STYLESHEET)
+    replacements = dict(load_color_table(theme, custom_colors).replacements, **{"corner-shape": corner_shape})
+    return "".join(Template(text, filters).render(replacements) for text in sections)
+
+
+def build() -> bytes:
+    """Render every variant and return the bundle file contents."""
+    variants = {}
+    for theme in ("dark", "light"):
+        for corner_shape in ("rounded", "sharp"):
+            for accent in [None] + list(common.ACCENT_COLORS[theme].values()):
+                custom_colors = None if accent is None else {"primary": accent}
+                for with_icons in (False, True):
+                    svgs = []
+                    text = _render(theme, corner_shape, custom_colors, with_icons, svgs)
+                    key = _bundle.variant_key(theme, corner_shape, _canonical_custom_colors(custom_colors), with_icons)
+                    variants[key] = (text.encode("utf-8"), svgs)
+
+    # Variants differ mostly in colors, so one of them as the preset dictionary shrinks the rest.
+    zdict = variants[_bundle.variant_key("dark", "rounded", "null", True)][0][-32768:]
+    data = [zdict]
+    offset = len(zdict)
+    index = {"sources": _bundle.sources_hash(), "zdict": [0, len(zdict)], "svgs": [], "variants": {}}
+    svg_indexes = {}
+    for key, (text, svgs) in variants.items():
+        compressor = zlib.compressobj(9, zdict=zdict)
+        compressed = compressor.compress(text) + compressor.flush()
+        for svg in svgs:
+            if tuple(svg) not in svg_indexes:
+                svg_indexes[tuple(svg)] = len(index["svgs"])
+                index["svgs"].append(svg)
+        index["variants"][key] = [offset, len(compressed), [svg_indexes[tuple(svg)] for svg in svgs]]
+        data.append(compressed)
+        offset += len(compressed)
+    index_bytes = json.dumps(index, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return _bundle.MAGIC + struct.pack("<I", len(index_bytes)) + index_bytes + b"".join(data)
+
+
+def main() -> None:
+    """Write the bundle of the pre-rendered stylesheets."""
+    contents = build()
+    with open(str(_bundle.BUNDLE_PATH), "wb") as f:
+        f.write(contents)
+    print("Wrote {} ({} bytes)".format(_bundle.BUNDLE_PATH, len(contents)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Build ``qdarktheme/_resources/plans.py`` from the template stylesheets.
+
+Run this after changing ``qdarktheme/_resources/stylesheets.py``::
+
+    python tools/build_plans.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from qdarktheme._resources import stylesheets  # noqa: E402
+from qdarktheme._template.engine import _CompiledTemplate  # noqa: E402
+
+_HEADER = '''"""Render plans of the template stylesheets.
+
+**Warning**
+
+This module created programmatically. All changes made in this file will be lost!
+Created by the `PyQtDarkTheme/tools/build_plans.py`.
+
+"""
+'''
+
+
+def main() -> None:
+    """Write the render plan of each template stylesheet."""
+    sections = [_HEADER]
+    for name in ("TEMPLATE_STYLESHEET", "TEMPLATE_STANDARD_ICONS_STYLESHEET"):
+        plan = _CompiledTemplate.parse(getattr(stylesheets, name))
+        items = "".join("    {!r}: {!r},\n".format(key, value) for key, value in plan.items())
+        sections.append("{}_PLAN = {{\n{}}}\n".format(name, items))
+    path = os.path.join(os.path.dirname(__file__), "..", "qdarktheme", "_resources", "plans.py")
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write("\n".join(sections))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,15 @@
+from functools import lru_cache
 from winreg import *
 from . import styledark_rc
 
 
+@lru_cache(maxsize=1)
+def _qss_parts():
+    """Read the qss once and split it at the accent placeholders."""
+    with open(__file__[:-2] + "qss", "r") as ff:
+        return ff.read().split("{accent}")
+
+
 def stylesheet():
     try:
         registry = ConnectRegistry(None, HKEY_CURRENT_USER)
@@ -16,5 +24,4 @@ def stylesheet():
     accent = str(hex(accent)).split("x")[1]
     accent = accent[4:6] + accent[2:4] + accent[0:2]
     accent = "rgb" + str(tuple(int(accent[i : i + 2], 16) for i in (0, 2, 4)))
-    with open(__file__[:-2] + "qss", "r") as ff:
-        return ff.read().replace("{accent}", accent)
+    return accent.join(_qss_parts())